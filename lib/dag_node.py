@@ -2,8 +2,80 @@
 This module provides a 'DagNode' class that represents a dag Node in a Maya scene.
 """
 
+import contextlib
+import functools
+import math
+
 from maya import cmds
+from maya.api import OpenMaya as om
 from craftRig.lib import node
+from craftRig.lib import scene
+
+# A reload runs the module again in the same namespace, so the callbacks of the
+# previous run, bound to its functions, are removed before any new one is added
+if globals().get('_CALLBACK_IDS'):
+    om.MMessage.removeCallbacks(_CALLBACK_IDS)
+
+_CALLBACK_IDS = []
+_UNSET = (None, None, None)
+
+
+def _memoized(method):
+    """Memoize the result of a DagNode getter until the hierarchy changes
+
+    Args:
+        method (function): Getter without arguments to memoize
+
+    Returns:
+        function: The memoized getter
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        if not self.node_exists():
+            return method(self)
+
+        if self._cache_generation != DagNode._generation:
+            self._cache.clear()
+            self._cache_generation = DagNode._generation
+        self._path_generation = DagNode._generation
+
+        key = method.__name__
+        if key not in self._cache:
+            _watch_scene()
+            self._cache[key] = method(self)
+
+        return self._cache[key]
+
+    return wrapper
+
+
+def _on_dag_changed(*args) -> None:
+    """Invalidate every memoized result when any hierarchy or name changes
+
+    Args:
+        args: Callback arguments
+    """
+
+    DagNode.clear_cache()
+
+
+def _watch_scene() -> None:
+    """Register once the shared callbacks that invalidate the memoized results
+
+    Note:
+        The callbacks are global so no callback is registered per node, and
+        they are also triggered by the edits replayed by undo and redo
+    """
+
+    if _CALLBACK_IDS:
+        return
+
+    _CALLBACK_IDS.extend((
+        om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, _on_dag_changed),
+        om.MDagMessage.addParentAddedCallback(_on_dag_changed),
+        om.MDagMessage.addParentRemovedCallback(_on_dag_changed),
+        om.MDagMessage.addChildReorderedCallback(_on_dag_changed)))
 
 
 class DagNode(node.Node):
@@ -11,6 +83,12 @@ class DagNode(node.Node):
     DagNode class
     """
 
+    __slots__ = ('_node_type', '_dag_path', '_plugs', '_cache', '_cache_generation',
+                 '_path_generation')
+
+    _generation = 0
+    _batch_depth = 0
+
     def __init__(self, name: str, node_type: str = '') -> None:
         """DagNode class constructor
 
@@ -20,8 +98,110 @@ class DagNode(node.Node):
         """
 
         super().__init__(name=name, node_type=node_type)
-        self.name = name
-        self.node_type = node_type
+        self._dag_path = None
+        self._plugs = {}
+        self._cache = {}
+        self._cache_generation = DagNode._generation
+
+    @property
+    def node_type(self) -> str:
+        """The type of the node, read from the scene the first time it is needed
+
+        Returns:
+            str: The type of the node, or an empty string if it does not exist
+
+        Example:
+        >>> dag_node = DagNode('pCube1')
+        >>> dag_node.node_type
+        'transform'
+        """
+
+        if not self._node_type and self.node_exists():
+            self._node_type = om.MFnDependencyNode(self._handle.object()).typeName
+
+        return self._node_type
+
+    @node_type.setter
+    def node_type(self, value: str) -> None:
+        """Set the type of the node
+
+        Args:
+            value (str): The type of the node
+        """
+
+        self._node_type = value
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Invalidate the memoized results of every DagNode
+
+        Example:
+        >>> DagNode.clear_cache()
+        """
+
+        DagNode._generation += 1
+
+    @classmethod
+    def remove_callbacks(cls) -> None:
+        """Remove the scene callbacks that invalidate the memoized results
+
+        Note:
+            They are registered again by the next existence check or memoized query
+
+        Example:
+        >>> DagNode.remove_callbacks()
+        """
+
+        if _CALLBACK_IDS:
+            om.MMessage.removeCallbacks(_CALLBACK_IDS)
+            del _CALLBACK_IDS[:]
+
+        DagNode.clear_cache()
+
+    @classmethod
+    @contextlib.contextmanager
+    def edit_batch(cls) -> None:
+        """Group the edits of every DagNode setter in a single undo step
+
+        Note:
+            Nested batches join the outermost one, so the whole block is
+            reverted by a single undo
+
+        Example:
+        >>> with DagNode.edit_batch():
+        ...     DagNode('pCube1').set_visible(False)
+        ...     DagNode('pCube2').set_translation(1.0, 2.0, 3.0)
+        """
+
+        if not DagNode._batch_depth:
+            cmds.undoInfo(openChunk=True, chunkName='DagNode.edit_batch')
+        DagNode._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            DagNode._batch_depth -= 1
+            if not DagNode._batch_depth:
+                cmds.undoInfo(closeChunk=True)
+
+    @classmethod
+    @contextlib.contextmanager
+    def bulk_edit(cls) -> None:
+        """Batch the edits of every DagNode setter while the evaluation manager
+        and the viewport refresh are suspended
+
+        Note:
+            The dirty propagation of the edits is deferred until the block exits
+
+        Example:
+        >>> with DagNode.bulk_edit():
+        ...     for dag_node in DagNode.from_selection_all():
+        ...         dag_node.set_translation(0.0, 0.0, 0.0)
+        """
+
+        with scene.Scene.suspend_evaluation():
+            with cls.edit_batch():
+                yield
 
     @classmethod
     def from_string(cls, text: str) -> 'DagNode':
@@ -39,7 +219,7 @@ class DagNode(node.Node):
         'test'
         """
 
-        return DagNode(name=text, node_type=cmds.nodeType(text))
+        return cls(name=text)
 
     @classmethod
     def from_selection(cls) -> 'DagNode':
@@ -54,14 +234,186 @@ class DagNode(node.Node):
         'pCube1'
         """
 
-        selection = cmds.ls(sl=True) or []
+        selection = om.MGlobal.getActiveSelectionList()
+
+        if not selection.length():
+            return None
 
-        if not selection:
+        try:
+            dag_path = selection.getDagPath(0)
+        except TypeError:
             return None
 
-        return DagNode.from_string(text=selection[0])
+        dag_node = cls(name=dag_path.partialPathName())
+        dag_node._bind(dag_path)
+        return dag_node
+
+    @classmethod
+    def from_strings(cls, texts: list[str]) -> list['DagNode']:
+        """Create DagNode objects from a list of strings
+
+        Args:
+            texts (list[str]): Names of the nodes
+
+        Returns:
+            list[DagNode]: DagNode objects
+
+        Example:
+        >>> dag_nodes = DagNode.from_strings(['pCube1', 'pCube2'])
+        >>> [dag_node.name for dag_node in dag_nodes]
+        ['pCube1', 'pCube2']
+        """
+
+        selection = om.MSelectionList()
+        dag_nodes = []
+
+        for text in texts:
+            selection.clear()
+            selection.add(text)
+            dag_path = selection.getDagPath(0)
+
+            dag_node = cls(name=text)
+            dag_node._bind(dag_path)
+            dag_nodes.append(dag_node)
+
+        return dag_nodes
+
+    @classmethod
+    def from_selection_all(cls) -> list['DagNode']:
+        """Create DagNode objects from every dag node in the selection
+
+        Returns:
+            list[DagNode]: DagNode objects
+
+        Example:
+        >>> dag_nodes = DagNode.from_selection_all()
+        >>> [dag_node.name for dag_node in dag_nodes]
+        ['pCube1', 'pCube2']
+        """
+
+        selection = om.MGlobal.getActiveSelectionList()
+        dag_nodes = []
+
+        for i in range(selection.length()):
+            try:
+                dag_path = selection.getDagPath(i)
+            except TypeError:
+                continue
+
+            dag_node = cls(name=dag_path.partialPathName())
+            dag_node._bind(dag_path)
+            dag_nodes.append(dag_node)
+
+        return dag_nodes
+
+    # HELPERS
+    def _resolve(self) -> bool:
+        """Resolve the name of the node to a cached MDagPath and MObjectHandle
+
+        Returns:
+            bool: True if the node was resolved, False otherwise
+        """
+
+        self._cache.clear()
+        selection = om.MSelectionList()
+
+        try:
+            selection.add(self.name)
+            dag_path = selection.getDagPath(0)
+        except (RuntimeError, TypeError):
+            self._handle = None
+            self._dag_path = None
+            return False
+
+        self._bind(dag_path)
+        return True
+
+    def _bind(self, dag_path: om.MDagPath) -> None:
+        """Cache an already resolved MDagPath and its MObjectHandle
+
+        Args:
+            dag_path (om.MDagPath): The dag path of the node
+        """
+
+        _watch_scene()
+        self._handle = om.MObjectHandle(dag_path.node())
+        self._dag_path = dag_path
+        self._plugs = {}
+        self._path_generation = DagNode._generation
+
+    def _get_plug(self, attribute_name: str) -> om.MPlug:
+        """Get a plug of the node, resolved once and cached
+
+        Args:
+            attribute_name (str): The name of the attribute
+
+        Returns:
+            om.MPlug: The plug of the attribute
+        """
+
+        plug = self._plugs.get(attribute_name)
+        if plug is None:
+            dag_node = om.MFnDagNode(self._dag_path)
+            plug = self._plugs[attribute_name] = dag_node.findPlug(attribute_name, False)
+
+        return plug
+
+    def _get_rotate_order(self) -> int:
+        """Get the rotate order of the node as an MEulerRotation order
+
+        Returns:
+            int: The rotate order of the node
+        """
+
+        return self._get_plug('rotateOrder').asInt()
 
     # VALIDATORS
+    def node_exists(self) -> bool:
+        """Check if the node exists in the scene
+
+        Note:
+            The node is resolved once and tracked through its MObjectHandle,
+            so it is still found after being renamed and its name is updated
+            to match. The handle is checked with isValid rather than isAlive,
+            as a deleted node kept by the undo queue is still alive
+            The path and the name are only refreshed after a node of the scene
+            has been renamed or reparented
+            Inside frozen_scene or _exists_scope the check is skipped, like Node
+
+        Returns:
+            bool: True if the node exists, False otherwise
+
+        Example:
+        >>> dag_node = DagNode('pCube1')
+        >>> dag_node.node_exists()
+        True
+        >>> bool(dag_node)
+        True
+        """
+
+        # A frozen node still needs its path resolved once
+        if node._FROZEN and self._handle is not None:
+            return True
+
+        if self._exists_cached is not None:
+            return self._exists_cached
+
+        handle = self._handle
+        if handle is None or not handle.isValid():
+            return self._resolve()
+
+        if self._path_generation != DagNode._generation:
+            _watch_scene()
+            if not self._dag_path.isValid():
+                self._dag_path = om.MDagPath.getAPathTo(handle.object())
+
+            self._sync_name(handle.object())
+            self._path_generation = DagNode._generation
+
+        return True
+
+    __bool__ = node_exists
+
     def is_template(self) -> bool:
         """Check if the DagNode is set to template.
 
@@ -77,7 +429,7 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        return cmds.getAttr(f'{self.name}.template')
+        return self._get_plug('template').asBool()
 
     def is_visible(self) -> bool:
         """Check if the DagNode is visible.
@@ -93,7 +445,7 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        return cmds.getAttr(f'{self.name}.visibility')
+        return self._get_plug('visibility').asBool()
 
     def is_in_hierarchy(self) -> bool:
         """Check if the node is in the hierarchy.
@@ -113,167 +465,277 @@ class DagNode(node.Node):
         return True if self.get_parent() else False
 
     # GETTERS
-    def get_parent(self) -> str:
+    @_memoized
+    def get_parent(self) -> tuple[str]:
         """Gets the parent of the node.
 
         Returns:
-            str or None: The name of the parent node, or None if it has no parent.
+            tuple[str]: The name of the parent node, or an empty tuple if it has no parent.
 
         Example:
             >>> node = Node('transform')
             >>> node.get_parent()
-            []
+            ()
         """
 
         if not self.node_exists():
-            return []
+            return ()
+
+        dag_node = om.MFnDagNode(self._dag_path)
+        parent = dag_node.parent(0)
+
+        if parent.hasFn(om.MFn.kWorld):
+            return ()
 
-        return cmds.listRelatives(self.name, p=True) or []
+        return (om.MDagPath.getAPathTo(parent).partialPathName(),)
 
-    def get_parents(self) -> list[str]:
+    @_memoized
+    def get_parents(self) -> tuple[str]:
         """Get all parents of the node.
 
         Returns:
-            list[str]: A list of the names of all parents nodes.
+            tuple[str]: The names of all parents nodes.
 
         Example:
             >>> node = DagNode('pCube4')
             >>> node.get_parents()
-            ['pCube2', 'pCube1']
+            ('pCube2', 'pCube1')
         """
 
         if not self.node_exists():
-            return []
+            return ()
 
-        return cmds.listRelatives(self.name, ap=True) or []
+        dag_node = om.MFnDagNode(self._dag_path)
+        parents = (dag_node.parent(i) for i in range(dag_node.parentCount()))
 
-    def get_child(self) -> str:
+        return tuple(om.MDagPath.getAPathTo(parent).partialPathName()
+                     for parent in parents if not parent.hasFn(om.MFn.kWorld))
+
+    @_memoized
+    def get_child(self) -> tuple[str]:
         """Gets the child of the node.
 
         Returns:
-            list: A list of the names of the child nodes.
+            tuple[str]: The names of the child nodes.
 
         Example:
         >>> node = Node('pCube1')
         >>> node.get_children()
-        ['pCube2','pCube3']
+        ('pCube2', 'pCube3')
         """
         if not self.node_exists():
-            return []
+            return ()
+
+        dag_node = om.MFnDagNode(self._dag_path)
+        children = (dag_node.child(i) for i in range(dag_node.childCount()))
 
-        return cmds.listRelatives(self.name, c=True) or []
+        return tuple(om.MDagPath.getAPathTo(child).partialPathName() for child in children)
 
-    def get_children(self) -> list[str]:
+    def get_children(self) -> tuple[str]:
         """Get all children of the node.
 
+        Note:
+            Instanced descendants are listed once per path below the node
+
         Returns:
-            list[str]: A list of the names of all descendant nodes.
+            tuple[str]: The full path names of all descendant nodes.
 
         Example:
             >>> node = DagNode('pCube1')
             >>> node.get_descendants()
-            ['pCube2', 'pCube3', 'pCube4']
+            ('|pCube1|pCube2', '|pCube1|pCube2|pCube3', '|pCube1|pCube4')
         """
 
         if not self.node_exists():
-            return []
+            return ()
+
+        iterator = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kInvalid)
+        iterator.reset(self._dag_path, om.MItDag.kDepthFirst, om.MFn.kInvalid)
+        iterator.next()
 
-        return cmds.listRelatives(self.name, True) or []
+        descendants = []
+        while not iterator.isDone():
+            descendants.append(iterator.fullPathName())
+            iterator.next()
 
-    def get_translation(self, world_space: bool = True) -> list[float]:
+        return tuple(descendants)
+
+    def get_translation(self, world_space: bool = True) -> om.MVector:
         """Get the translation of the node.
 
         Args:
             world_space (bool, optional): The space to get the translation. Defaults to Trie
 
         Returns:
-            list[float]: A list of the x, y, and z translation values.
+            om.MVector: The x, y, and z translation values.
 
         Example:
             >>> node = DagNode('pCube1')
             >>> node.get_translation()
-            [1.0, 2.0, 3.0]
+            maya.api.OpenMaya.MVector(1, 2, 3)
         """
 
         if not self.node_exists():
-            return []
+            return ()
 
-        return cmds.xform(self.name, True, t=True, ws=world_space)
+        return self.get_trs(world_space=world_space)[0]
 
-    def get_rotation(self, world_space: bool = True) -> list[float]:
+    def get_rotation(self, world_space: bool = True) -> tuple[float]:
         """Get the rotation of the node.
 
         Args:
             world_space (bool, optional): The space to get the rotation. Defaults to True
 
         Returns:
-            list[float]: A list of the x, y, and z rotation values.
+            tuple[float]: The x, y, and z rotation values.
 
         Example:
             >>> node = DagNode('pCube1')
             >>> node.get_rotation()
-            [0.0, 45.0, 0.0]
+            (0.0, 45.0, 0.0)
         """
 
         if not self.node_exists():
-            return []
+            return ()
 
-        return cmds.xform(self.name, True, r=True, ws=world_space)
+        return self.get_trs(world_space=world_space)[1]
 
-    def get_scale(self) -> list[float]:
+    def get_scale(self) -> tuple[float]:
         """Get the scale of the node.
 
         Returns:
-            list[float]: A list of the x, y, and z scale values.
+            tuple[float]: The x, y, and z scale values.
 
         Example:
             >>> node = DagNode('pCube1')
             >>> node.get_scale()
-            [1.0, 1.0, 1.0]
+            (1.0, 1.0, 1.0)
+        """
+
+        if not self.node_exists():
+            return ()
+
+        return self.get_trs()[2]
+
+    def get_trs(self, world_space: bool = True) -> tuple[om.MVector, tuple[float], tuple[float]]:
+        """Get the translation, rotation and scale of the node in a single query.
+
+        Args:
+            world_space (bool, optional): The space to get the translation and rotation.
+                                          Defaults to True
+
+        Returns:
+            tuple[om.MVector, tuple[float], tuple[float]]: The x, y, and z translation,
+                                                           rotation and scale values.
+
+        Note:
+            The scale is always returned in object space
+
+        Example:
+            >>> node = DagNode('pCube1')
+            >>> node.get_trs()
+            (maya.api.OpenMaya.MVector(1, 2, 3), (0.0, 45.0, 0.0), (1.0, 1.0, 1.0))
         """
 
         if not self.node_exists():
-            return []
+            return (), (), ()
+
+        transform = om.MFnTransform(self._dag_path)
+
+        if world_space:
+            matrix = om.MTransformationMatrix(self._dag_path.inclusiveMatrix())
+            rotation = matrix.rotation().reorder(self._get_rotate_order())
+        else:
+            matrix = transform.transformation()
+            rotation = matrix.rotation()
+
+        translation = matrix.translation(om.MSpace.kTransform)
+        rotation = tuple(math.degrees(angle) for angle in (rotation.x, rotation.y, rotation.z))
 
-        return cmds.xform(self.name, True, s=True)
+        return translation, rotation, tuple(transform.scale())
 
-    def get_matrix(self, world_space: bool = True) -> list[float]:
+    def get_matrix(self, world_space: bool = True) -> om.MMatrix:
         """Get the world matrix of the node.
 
         Args:
             world_space (bool, optional): The space to get the matrix. Defaults to True
 
         Returns:
-            list[float]: A list representing the 4x4 world matrix.
+            om.MMatrix: The 4x4 world matrix, list() it to get the 16 values.
+
+        Example:
+            >>> node = DagNode('pCube1')
+            >>> list(node.get_world_matrix())
+            [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0, 1.0, 2.0, 3.0, 1.0]
+        """
+
+        if world_space:
+            return self.get_world_matrix()
+
+        return self.get_local_matrix()
+
+    def get_world_matrix(self) -> om.MMatrix:
+        """Get the world matrix of the node.
+
+        Returns:
+            om.MMatrix: The 4x4 world matrix.
+
+        Example:
+            >>> node = DagNode('pCube1')
+            >>> list(node.get_world_matrix())
+            [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0, 1.0, 2.0, 3.0, 1.0]
+        """
+
+        if not self.node_exists():
+            return ()
+
+        return self._dag_path.inclusiveMatrix()
+
+    def get_local_matrix(self) -> om.MMatrix:
+        """Get the local matrix of the node.
+
+        Returns:
+            om.MMatrix: The 4x4 local matrix.
 
         Example:
             >>> node = DagNode('pCube1')
-            >>> node.get_world_matrix()
+            >>> list(node.get_local_matrix())
             [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0,
                 0.0, 0.0, 1.0, 0.0, 1.0, 2.0, 3.0, 1.0]
         """
 
         if not self.node_exists():
-            return []
+            return ()
 
-        return cmds.xform(self.name, q=True, m=True, ws=world_space, os=not world_space)
+        return om.MFnTransform(self._dag_path).transformationMatrix()
 
-    def get_shapes(self) -> list[str]:
+    @_memoized
+    def get_shapes(self) -> tuple[str]:
         """Get the shapes of the node.
 
         Returns:
-            list[str]: A list of the names of the shape nodes.
+            tuple[str]: The names of the shape nodes.
 
         Example:
             >>> node = DagNode('pCube1')
             >>> node.get_shapes()
-            ['pCubeShape1']
+            ('|pCube1|pCubeShape1',)
         """
 
         if not self.node_exists():
-            return []
+            return ()
+
+        dag_path = self._dag_path
+        shapes = []
 
-        return cmds.listRelatives(self.name, s=True, f=True) or []
+        for i in range(dag_path.numberOfShapesDirectlyBelow()):
+            shape_path = om.MDagPath(dag_path)
+            shape_path.extendToShape(i)
+            shapes.append(shape_path.fullPathName())
+
+        return tuple(shapes)
 
     # SETTERS
     def set_template(self, value: bool = True) -> bool:
@@ -293,7 +755,9 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        cmds.setAttr(f'{self.name}.template', value)
+        with self.edit_batch():
+            cmds.setAttr(f'{self._dag_path.fullPathName()}.template', value)
+
         return True
 
     def set_visible(self, value: bool = True) -> bool:
@@ -313,7 +777,9 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        cmds.setAttr(f'{self.name}.visibility', value)
+        with self.edit_batch():
+            cmds.setAttr(f'{self._dag_path.fullPathName()}.visibility', value)
+
         return True
 
     def set_translation(self, x: float, y: float, z: float, world_space: bool = True) -> bool:
@@ -334,11 +800,7 @@ class DagNode(node.Node):
             True
         """
 
-        if not self.node_exists():
-            return False
-
-        cmds.xform(self.name, t=[x, y, z], ws=world_space, os=not world_space)
-        return True
+        return self.set_trs(x=x, y=y, z=z, world_space=world_space)
 
     def set_rotation(self, x: float, y: float, z: float, world_space: bool = True) -> bool:
         """Set the rotation of the node.
@@ -358,11 +820,7 @@ class DagNode(node.Node):
             True
         """
 
-        if not self.node_exists():
-            return False
-
-        cmds.xform(self.name, r=[x, y, z], ws=world_space, os=not world_space)
-        return True
+        return self.set_trs(rx=x, ry=y, rz=z, world_space=world_space)
 
     def set_scale(self, x: float, y: float, z: float) -> bool:
         """Set the scale of the node.
@@ -381,17 +839,80 @@ class DagNode(node.Node):
             True
         """
 
+        return self.set_trs(sx=x, sy=y, sz=z)
+
+    def set_trs(self,
+                x: float = None,
+                y: float = None,
+                z: float = None,
+                rx: float = None,
+                ry: float = None,
+                rz: float = None,
+                sx: float = None,
+                sy: float = None,
+                sz: float = None,
+                world_space: bool = True) -> bool:
+        """Set the translation, rotation and scale of the node in a single edit.
+
+        Args:
+            x, y, z (float, optional): The translation values. Defaults to None.
+            rx, ry, rz (float, optional): The rotation values. Defaults to None.
+            sx, sy, sz (float, optional): The scale values. Defaults to None.
+            world_space (bool, optional): The space to set the translation and rotation in.
+                                          Defaults to True.
+
+        Returns:
+            bool: True if the transformation was set successfully, False otherwise.
+
+        Note:
+            Values left as None keep their current value, and a component with
+            all its values left as None is not modified
+            The scale is always set in object space
+
+        Example:
+            >>> node = DagNode('pCube1')
+            >>> node.set_trs(1.0, 2.0, 3.0, 0.0, 45.0, 0.0, 2.0, 2.0, 2.0)
+            True
+        """
+
         if not self.node_exists():
             return False
 
-        cmds.xform(self.name, s=[x, y, z])
+        components = ((x, y, z), (rx, ry, rz), (sx, sy, sz))
+
+        if any(None in values and values != _UNSET for values in components):
+            current = self.get_trs(world_space=world_space)
+            components = tuple(
+                values if values == _UNSET else
+                [default if value is None else value for value, default in zip(values, defaults)]
+                for values, defaults in zip(components, current))
+
+        translation, rotation, scale = (
+            None if values == _UNSET else values for values in components)
+
+        flags = {}
+        if translation is not None:
+            flags['translation'] = list(translation)
+        if rotation is not None:
+            flags['rotation'] = list(rotation)
+        if scale is not None:
+            flags['scale'] = list(scale)
+
+        if not flags:
+            return True
+
+        with self.edit_batch():
+            cmds.xform(self._dag_path.fullPathName(),
+                       worldSpace=world_space, objectSpace=not world_space, **flags)
+
         return True
 
     def set_matrix(self, matrix: list[float], world_space: bool = True) -> bool:
         """Set the world matrix of the node.
 
         Args:
-            matrix (list[float]): A list representing the 4x4 world matrix.
+            matrix (list[float], om.MMatrix): A list of 16 values or an MMatrix
+                                              representing the 4x4 world matrix.
             world_space (bool, optional): The space to get the matrix. Defaults to True
 
         Returns:
@@ -410,15 +931,24 @@ class DagNode(node.Node):
         if len(matrix) != 16:
             return False
 
-        cmds.xform(self.name, m=matrix, ws=world_space, os=not world_space)
+        with self.edit_batch():
+            cmds.xform(self._dag_path.fullPathName(), matrix=matrix,
+                       worldSpace=world_space, objectSpace=not world_space)
+
         return True
 
     # METHODS
-    def parent_to(self, parent_node: str, **kwargs: any) -> bool:
+    def parent_to(self,
+                  parent_node: 'str | DagNode',
+                  relative: bool = False,
+                  **kwargs: any) -> bool:
         """Parent the node to another node
 
         Args:
-            parent_node (str): the node to parent to
+            parent_node (str, DagNode): the node to parent to
+            relative (bool, optional): Keep the local transform values instead of
+                                       the world position. Defaults to False.
+            kwargs: Extra cmds.parent flags, such as shape or addObject
 
         Returns:
             bool: True if successfull, False otherwise
@@ -432,14 +962,34 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        cmds.parent(self.name, parent_node, **kwargs)
+        if isinstance(parent_node, DagNode):
+            if not parent_node.node_exists():
+                return False
+            parent_path = parent_node._dag_path
+        else:
+            selection = om.MSelectionList()
+
+            try:
+                selection.add(parent_node)
+                parent_path = selection.getDagPath(0)
+            except (RuntimeError, TypeError):
+                return False
+
+        # The short flag would be sent twice along with relative
+        relative = kwargs.pop('r', relative)
+
+        with self.edit_batch():
+            cmds.parent(self._dag_path.fullPathName(), parent_path.fullPathName(),
+                        relative=relative, **kwargs)
+
         return True
 
     def parent_to_world(self):
         """Parent the node to world
 
         Returns:
-            bool: rue if successfull, False otherwise
+            bool: True if successfull, False otherwise or if the node is already
+                  under the world
 
         Example:
         >>> node = Node('pCube1')
@@ -450,8 +1000,10 @@ class DagNode(node.Node):
         if not self.node_exists():
             return False
 
-        if self.get_parent():
-            cmds.parent(self.name, w=True)
-            return True
+        if self._dag_path.length() < 2:
+            return False
+
+        with self.edit_batch():
+            cmds.parent(self._dag_path.fullPathName(), world=True)
 
-        return False
+        return True
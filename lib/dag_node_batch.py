@@ -0,0 +1,145 @@
+"""
+This module provides a 'DagNodeBatch' class that reads and writes the transforms
+of many dag Nodes in a Maya scene at once.
+"""
+
+import math
+
+from maya.api import OpenMaya as om
+from craftRig.lib import dag_node
+
+
+class DagNodeBatch(object):
+    """
+    DagNodeBatch class
+    """
+
+    def __init__(self, nodes: list[dag_node.DagNode]) -> None:
+        """DagNodeBatch class constructor
+
+        Args:
+            nodes (list[DagNode]): The nodes of the batch, nodes that do not
+                                   exist in the scene are skipped
+        """
+
+        self.nodes = [node for node in nodes if node.node_exists()]
+
+        count = len(self.nodes)
+        self.translations = [None] * count
+        self.rotations = [None] * count
+        self.scales = [None] * count
+        self.matrices = [None] * count
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the batch
+
+        Returns:
+            int: The number of nodes
+        """
+
+        return len(self.nodes)
+
+    # GETTERS
+    def read_all(self, world_space: bool = True) -> None:
+        """Read the translation, rotation, scale and matrix of every node.
+
+        Args:
+            world_space (bool, optional): The space to read the translation, rotation
+                                          and matrix in. Defaults to True.
+
+        Note:
+            The values are stored in the translations, rotations, scales and
+            matrices lists, in the same order as the nodes
+            The scale is always read in object space
+            The nodes are checked again on every read, so a reparented node
+            is read from its new path and a deleted node reads as None
+
+        Example:
+            >>> batch = DagNodeBatch(DagNode.from_selection_all())
+            >>> batch.read_all()
+            >>> batch.translations
+            [(1.0, 2.0, 3.0), (0.0, 0.0, 0.0)]
+        """
+
+        transform = om.MFnTransform()
+        translations = self.translations
+        rotations = self.rotations
+        scales = self.scales
+        matrices = self.matrices
+
+        for i, node in enumerate(self.nodes):
+            if not node.node_exists():
+                translations[i] = rotations[i] = scales[i] = matrices[i] = None
+                continue
+
+            dag_path = node._dag_path
+            transform.setObject(dag_path)
+
+            if world_space:
+                matrix = dag_path.inclusiveMatrix()
+                transformation = om.MTransformationMatrix(matrix)
+                rotation = transformation.rotation().reorder(
+                    transform.findPlug('rotateOrder', False).asInt())
+            else:
+                transformation = transform.transformation()
+                matrix = transformation.asMatrix()
+                rotation = transformation.rotation()
+
+            translation = transformation.translation(om.MSpace.kTransform)
+
+            translations[i] = (translation.x, translation.y, translation.z)
+            rotations[i] = (math.degrees(rotation.x),
+                            math.degrees(rotation.y),
+                            math.degrees(rotation.z))
+            scales[i] = tuple(transform.scale())
+            matrices[i] = tuple(matrix)
+
+    # SETTERS
+    def write_all(self,
+                  translations: list[tuple[float, float, float]] = None,
+                  rotations: list[tuple[float, float, float]] = None,
+                  scales: list[tuple[float, float, float]] = None,
+                  world_space: bool = True) -> None:
+        """Write the translation, rotation and scale of every node.
+
+        Args:
+            translations (list[tuple[float, float, float]], optional): The translation
+                of each node. Defaults to None.
+            rotations (list[tuple[float, float, float]], optional): The rotation of each
+                node in degrees. Defaults to None.
+            scales (list[tuple[float, float, float]], optional): The scale of each node.
+                Defaults to None.
+            world_space (bool, optional): The space to write the translation and rotation
+                                          in. Defaults to True.
+
+        Raises:
+            ValueError: If a list does not hold one value per node
+
+        Note:
+            A component left as None is not modified
+            The scale is always written in object space
+            The writes go through the DagNode setters inside an edit batch, so
+            they are undone in a single step and join an enclosing edit batch
+
+        Example:
+            >>> batch = DagNodeBatch(DagNode.from_selection_all())
+            >>> batch.read_all()
+            >>> batch.write_all(translations=[(0.0, 0.0, 0.0)] * len(batch))
+        """
+
+        count = len(self.nodes)
+        for label, values in (('translations', translations),
+                              ('rotations', rotations),
+                              ('scales', scales)):
+            if values is not None and len(values) != count:
+                raise ValueError(f'Expected {count} {label}, one per node, got {len(values)}')
+
+        unset = (None, None, None)
+
+        with dag_node.DagNode.edit_batch():
+            for i, node in enumerate(self.nodes):
+                x, y, z = unset if translations is None else translations[i]
+                rx, ry, rz = unset if rotations is None else rotations[i]
+                sx, sy, sz = unset if scales is None else scales[i]
+
+                node.set_trs(x, y, z, rx, ry, rz, sx, sy, sz, world_space=world_space)
@@ -1,9 +1,49 @@
 """
 Module providing string manipulation facilities.
 """
+import functools
+import itertools
 import re
+import string
 from typing import Union
 
+_CACHE_SIZE = 4096
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LETTERS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+_ALPHANUMERICS = _LETTERS | _DIGITS
+_DIGITS_RE = re.compile(r'\d+')
+_BRACKETS_RE = re.compile(r"\[([^\]]+)\]")
+# Texts left unchanged by to_camel_case and to_pascal_case
+_CANONICAL_CAMEL_RE = re.compile(r'[a-z]+(?:[A-Z][a-z]+|[0-9]+)*')
+_CANONICAL_PASCAL_RE = re.compile(r'(?:[A-Z][a-z]+|[0-9]+)+')
+_DOT_TO_D = str.maketrans('.', 'd')
+_D_TO_DOT = str.maketrans('d', '.')
+
+
+class _NonAlnumTable(dict):
+    """Translate table mapping every character but ASCII letters and digits to a space"""
+
+    def __missing__(self, key: int) -> str:
+        # Only reached by non ASCII characters, which are never alphanumeric here
+        return ' '
+
+
+class _DigitTable(dict):
+    """Translate table deleting every Unicode decimal digit"""
+
+    def __missing__(self, key: int) -> Union[str, None]:
+        character = chr(key)
+        self[key] = None if character.isdecimal() else character
+        return self[key]
+
+
+_NON_ALNUM_TABLE = _NonAlnumTable(
+    (code, chr(code) if chr(code) in _ALPHANUMERICS else ' ') for code in range(128))
+_DIGIT_TABLE = _DigitTable(
+    (code, None if chr(code) in _DIGITS else chr(code)) for code in range(128))
+
 
 # VALIDATORS
 def is_string(text: str) -> bool:
@@ -44,6 +84,7 @@ def is_value(value: Union[int, float]) -> bool:
     return isinstance(value, (int, float))
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_camel_case(text: str) -> bool:
     """Validate if a text is in camelCase style
 
@@ -67,9 +108,16 @@ def is_camel_case(text: str) -> bool:
         False
     """
 
-    return bool(re.fullmatch(r"^[a-z]+([A-Z][a-z0-9]*)*$", text))
+    if not (text.isascii() and text.isalnum()) or text[0] not in _LOWERCASE:
+        return False
+
+    # Digits are only allowed after the first uppercase letter
+    rest = text.lstrip(string.ascii_lowercase)
 
+    return not rest or rest[0] in _UPPERCASE
 
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_pascal_case(text: str) -> bool:
     """Validate if a text is in PascalCase style
 
@@ -93,9 +141,10 @@ def is_pascal_case(text: str) -> bool:
         False
     """
 
-    return bool(re.fullmatch(r"^[A-Z][a-z0-9]*([A-Z][a-z0-9]*)*$", text))
+    return text.isascii() and text.isalnum() and text[0] in _UPPERCASE
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_snake_case(text: str) -> bool:
     """Validate if a text is in snake_case style
 
@@ -119,9 +168,10 @@ def is_snake_case(text: str) -> bool:
         False
     """
 
-    return bool(re.fullmatch(r"^[a-z]+(_[a-z0-9]+)*$", text))
+    return _is_delimited_case(text, '_')
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_kebab_case(text: str) -> bool:
     """Validate if a text is in kebab-case style
 
@@ -145,7 +195,34 @@ def is_kebab_case(text: str) -> bool:
         False
     """
 
-    return bool(re.fullmatch(r"^[a-z]+(-[a-z0-9]+)*$", text))
+    return _is_delimited_case(text, '-')
+
+
+def _is_delimited_case(text: str, separator: str) -> bool:
+    """Validate if a text is made of lowercase words joined by a separator
+
+    Args:
+        text (str): String to validate
+        separator (str): Separator between the words
+
+    Returns:
+        bool: True if the first word has only lowercase letters and the others
+              only lowercase letters and digits, False otherwise
+    """
+
+    words = text.split(separator)
+    first_word = words[0]
+
+    if not (first_word.isascii() and first_word.isalpha() and first_word.islower()):
+        return False
+
+    for word in words[1:]:
+        if not (word.isascii() and word.isalnum()):
+            return False
+        if not (word.islower() or word.isdigit()):
+            return False
+
+    return True
 
 
 def is_character_in(text: str, character: str = '_') -> bool:
@@ -169,11 +246,12 @@ def is_character_in(text: str, character: str = '_') -> bool:
         False
     """
 
-    return bool(character in text)
+    return character in text
 
 
 # GETTERS
-def get_case_style(text: str) -> bool:
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def get_case_style(text: str) -> str:
     """Determine the naming style of a given text.
 
     Args:
@@ -203,19 +281,21 @@ def get_case_style(text: str) -> bool:
         'unknown'
     """
 
-    if is_camel_case(text):
-        return "camelCase"
-    if is_pascal_case(text):
-        return "PascalCase"
-    if is_snake_case(text):
-        return "snake_case"
-    if is_kebab_case(text):
-        return "kebab-case"
+    # The styles are told apart by their separator or first character,
+    # so only one of them has to be validated
+    if not text:
+        return "unknown"
+    if '-' in text:
+        return "kebab-case" if is_kebab_case(text) else "unknown"
+    if '_' in text:
+        return "snake_case" if is_snake_case(text) else "unknown"
+    if text[0].isupper():
+        return "PascalCase" if is_pascal_case(text) else "unknown"
 
-    return "unknown"
+    return "camelCase" if is_camel_case(text) else "unknown"
 
 
-def get_digits(text: str) -> list:
+def get_digits(text: str) -> list[str]:
     """Get numbers inside a text
 
     Args:
@@ -238,7 +318,7 @@ def get_digits(text: str) -> list:
         []
     """
 
-    return re.findall(r'\d+', text)
+    return _DIGITS_RE.findall(text)
 
 
 def get_digit_by_index(text: str, index: int = 0) -> Union[str, list]:
@@ -265,6 +345,11 @@ def get_digit_by_index(text: str, index: int = 0) -> Union[str, list]:
         []
     """
 
+    if index == 0:
+        return get_first_number(text)
+    if index == -1:
+        return get_last_number(text)
+
     number = get_digits(text)
 
     return number[index] if number else []
@@ -293,9 +378,9 @@ def get_first_number(text: str) -> Union[str, list]:
         []
     """
 
-    number = get_digits(text)
+    match = _DIGITS_RE.search(text)
 
-    return number[0] if number else []
+    return match.group() if match else []
 
 
 def get_last_number(text: str) -> Union[str, list]:
@@ -321,12 +406,19 @@ def get_last_number(text: str) -> Union[str, list]:
         []
     """
 
-    number = get_digits(text=text)
+    # Walk back to the end of the last number, then to its start
+    end = len(text)
+    while end and not text[end - 1].isdecimal():
+        end -= 1
+
+    start = end
+    while start and text[start - 1].isdecimal():
+        start -= 1
 
-    return number[-1] if number else []
+    return text[start:end] if end else []
 
 
-def get_values_between_brackets(text: str) -> list:
+def get_values_between_brackets(text: str) -> list[str]:
     """Get all values between brackets inside a text
 
     Args:
@@ -350,14 +442,10 @@ def get_values_between_brackets(text: str) -> list:
         []
     """
 
-    results = re.findall(r"\[([^\]]+)\]", text)
-
-    numeric_results = []
-    for item in results:
-        numbers = re.findall(r'\d+', item)
-        numeric_results.extend(numbers)
-
-    return numeric_results if numeric_results else []
+    # Scan the digits in place instead of on a copy of the bracket content
+    return list(itertools.chain.from_iterable(
+        _DIGITS_RE.findall(text, match.start(1), match.end(1))
+        for match in _BRACKETS_RE.finditer(text)))
 
 
 # CONVERTERS
@@ -405,9 +493,23 @@ def normalize_text(text: str) -> str:
         'name of variable '
     """
 
-    return re.sub(r'[^a-zA-Z0-9]+', ' ', text)
+    if text.isascii() and text.isalnum():
+        return text
+
+    translated = text.translate(_NON_ALNUM_TABLE)
+    words = translated.split()
+
+    if not words:
+        return ' ' if text else ''
+
+    # Runs of spaces collapse to one, including the leading and trailing ones
+    leading = ' ' if translated[0] == ' ' else ''
+    trailing = ' ' if translated[-1] == ' ' else ''
 
+    return leading + ' '.join(words) + trailing
 
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def to_camel_case(text: str, delete_numbers: bool = False) -> str:
     """Convert a text to camelCase
 
@@ -429,12 +531,12 @@ def to_camel_case(text: str, delete_numbers: bool = False) -> str:
         'nameOfVariable'
     """
 
-    splited_text = split_text(text)
+    if not delete_numbers and _CANONICAL_CAMEL_RE.fullmatch(text):
+        return text
 
-    camel_case = splited_text[0].lower()
+    splited_text = _split_words(text)
 
-    for word in splited_text[1:]:
-        camel_case += word.capitalize()
+    camel_case = splited_text[0].lower() + ''.join(word.capitalize() for word in splited_text[1:])
 
     if delete_numbers:
         camel_case = remove_numbers(camel_case)
@@ -442,6 +544,7 @@ def to_camel_case(text: str, delete_numbers: bool = False) -> str:
     return camel_case
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def to_pascal_case(text: str, delete_numbers: bool = False) -> str:
     """Convert a text to PascalCase
 
@@ -463,11 +566,12 @@ def to_pascal_case(text: str, delete_numbers: bool = False) -> str:
         'NameOfVariable'
     """
 
-    splited_text = split_text(text)
+    if not delete_numbers and _CANONICAL_PASCAL_RE.fullmatch(text):
+        return text
+
+    splited_text = _split_words(text)
 
-    pascal_case = ''
-    for word in splited_text:
-        pascal_case += word.capitalize()
+    pascal_case = ''.join(word.capitalize() for word in splited_text)
 
     if delete_numbers:
         pascal_case = remove_numbers(pascal_case)
@@ -475,6 +579,28 @@ def to_pascal_case(text: str, delete_numbers: bool = False) -> str:
     return pascal_case
 
 
+def _join_lower_words(text: str, separator: str, delete_numbers: bool = False) -> str:
+    """Join the lowercased words of a text with a separator
+
+    Args:
+        text (str): Text to convert
+        separator (str): Separator between the words
+        delete_numbers (bool): Skip the numbers of the text. Defaults to False
+
+    Returns:
+        str: The joined words
+    """
+
+    words = _split_words(text)
+
+    # Words are either all letters or all digits, so the numbers are whole words
+    if delete_numbers:
+        words = [word for word in words if not word.isdigit()]
+
+    return separator.join(map(str.lower, words))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def to_snake_case(text: str, delete_numbers: bool = False) -> str:
     """Convert a text to snake_case
 
@@ -496,20 +622,10 @@ def to_snake_case(text: str, delete_numbers: bool = False) -> str:
         'name_of_variable'
     """
 
-    splited_text = split_text(text)
-
-    snake_case = []
-    for word in splited_text:
-        snake_case.append(word.lower())
-    snake_case = '_'.join(snake_case)
-
-    if delete_numbers:
-        snake_case = remove_numbers(snake_case)
-        snake_case = to_snake_case(snake_case)
-
-    return snake_case
+    return _join_lower_words(text, '_', delete_numbers)
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def to_kebab_case(text: str, delete_numbers: bool = False) -> str:
     """Convert a text to kebab-case.
 
@@ -534,18 +650,7 @@ def to_kebab_case(text: str, delete_numbers: bool = False) -> str:
         'name-of-variable'
     """
 
-    splited_text = split_text(text)
-
-    kebab_case = []
-    for word in splited_text:
-        kebab_case.append(word.lower())
-    kebab_case = '-'.join(kebab_case)
-
-    if delete_numbers:
-        kebab_case = remove_numbers(kebab_case)
-        kebab_case = to_kebab_case(kebab_case)
-
-    return kebab_case
+    return _join_lower_words(text, '-', delete_numbers)
 
 
 def convert_value_to_text(value: Union[int, float]) -> str:
@@ -568,14 +673,38 @@ def convert_value_to_text(value: Union[int, float]) -> str:
         '12d75'
     """
 
-    sign = ''
+    # 0.0 and -0.0 are the same cache key but are formatted differently
+    if value == 0:
+        return _format_value(value)
+
+    return _format_value_cached(value)
+
+
+def _format_value(value: Union[int, float]) -> str:
+    """Format a number as Mxdx text
+
+    Args:
+        value(int, float): Value to convert to string
+
+    Returns:
+        str: Converted value
+    """
+
+    # Integers have no decimal point to replace
+    if isinstance(value, int):
+        return f'M{-value}' if value < 0 else str(value)
+
     if value < 0:
-        sign = 'M'
-        value = abs(value)  # Convert value to positive
+        return 'M' + str(-value).translate(_DOT_TO_D)
+
+    return str(value).translate(_DOT_TO_D)
+
 
-    return f'{sign}{value}'.replace('.', 'd')
+# Typed so that 1, 1.0 and True, which are equal keys, keep their own text
+_format_value_cached = functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)(_format_value)
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def convert_text_to_value(text: str) -> float:
     """Convert a formatted string (Mxdx) into a number
 
@@ -601,12 +730,10 @@ def convert_text_to_value(text: str) -> float:
         -100.01
     """
 
-    sign = 1
-    if text[0] == 'M':
-        sign = -1
-        text = text[1:]
+    if text.startswith('M'):
+        return float(text[1:].translate(_D_TO_DOT)) * -1
 
-    return float(text.replace('d', '.')) * sign
+    return float(text.translate(_D_TO_DOT))
 
 
 def remove_numbers(text: str) -> str:
@@ -629,7 +756,7 @@ def remove_numbers(text: str) -> str:
         'nameOfVariable'
     """
 
-    return re.sub(r'\d+', '', text)
+    return text.translate(_DIGIT_TABLE)
 
 
 def split_text(text: str) -> list:
@@ -651,7 +778,66 @@ def split_text(text: str) -> list:
         >>> split_text('Another_Example-Here99')
         ['Another', 'Example', 'Here', '99']
     """
-    return re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=\s|$)|[0-9]+|[a-z]+|[A-Za-z]+(?=[_-])', text)
+
+    return list(_split_words(text))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _split_words(text: str) -> tuple[str, ...]:
+    """Split text into individual words, cached and returned as an immutable tuple
+
+    Args:
+        text (str): The text to split
+
+    Returns:
+        tuple: The words of the text
+    """
+
+    words = []
+    length = len(text)
+    index = 0
+
+    while index < length:
+        character = text[index]
+        end = index + 1
+
+        # Lowercase word, optionally starting with a single uppercase letter
+        if character in _LOWERCASE or (
+                character in _UPPERCASE and end < length and text[end] in _LOWERCASE):
+            while end < length and text[end] in _LOWERCASE:
+                end += 1
+            words.append(text[index:end])
+            index = end
+            continue
+
+        # Number
+        if character in _DIGITS:
+            while end < length and text[end] in _DIGITS:
+                end += 1
+            words.append(text[index:end])
+            index = end
+            continue
+
+        if character in _UPPERCASE:
+            # Uppercase word followed by a space or the end of the text
+            while end < length and text[end] in _UPPERCASE:
+                end += 1
+            if end == length or text[end].isspace():
+                words.append(text[index:end])
+                index = end
+                continue
+
+            # Any word followed by a '_' or '-' delimiter
+            while end < length and text[end] in _LETTERS:
+                end += 1
+            if end < length and text[end] in '_-':
+                words.append(text[index:end])
+                index = end
+                continue
+
+        index += 1
+
+    return tuple(words)
 
 
 def capitalize_first(text: str) -> str:
@@ -673,13 +859,162 @@ def capitalize_first(text: str) -> str:
         >>> capitalize_first('name-of-variable')
         'Name-of-variable'
     """
-    if len(text) == 1:
-        return text.upper()
-
-    return text[0].upper() + text[1:]
+    return text[:1].upper() + text[1:]
 
 
 # INCREMENTERS
+def _split_last_number(text: str) -> tuple[str, str]:
+    """Split a text into the part before its trailing number and the number
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        tuple[str, str]: The text before the number and the number, which is
+                         empty if the text does not end with a number
+
+    Note:
+        A single trailing newline after the number is dropped, matching the
+        end of line anchor of the regex search this replaced
+    """
+
+    end = len(text)
+    if text.endswith('\n'):
+        end -= 1
+
+    start = end
+    while start and text[start - 1].isdecimal():
+        start -= 1
+
+    if start == end:
+        return text, ''
+
+    return text[:start], text[start:end]
+
+
+def _letters_to_number(text: str, start: int) -> int:
+    """Convert a letter sequence to its bijective base-26 value
+
+    Args:
+        text (str): A text containing only letters of the same case
+        start (int): Code point of the first letter, ord('A') or ord('a')
+
+    Returns:
+        int: The value of the sequence, 'A' being 1 and 'AA' 27
+    """
+
+    number = 0
+    for character in text:
+        number = number * 26 + ord(character) - start + 1
+
+    return number
+
+
+def _number_to_letters(number: int, start: int) -> str:
+    """Convert a bijective base-26 value to its letter sequence
+
+    Args:
+        number (int): The value to convert, 0 gives an empty text
+        start (int): Code point of the first letter, ord('A') or ord('a')
+
+    Returns:
+        str: The letter sequence of the value
+    """
+
+    characters = []
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        characters.append(chr(start + remainder))
+
+    return ''.join(reversed(characters))
+
+
+def _split_trailing_letters(text: str) -> tuple[str, str, int]:
+    """Split a text into its prefix and its trailing run of ASCII letters of the
+    same case as the first character of the text
+
+    Args:
+        text (str): The text to split
+
+    Returns:
+        tuple[str, str, int]: The prefix, the trailing letters and the code point of
+                              their first letter. The letters are empty if the text
+                              does not end with letters of the case of its first character
+    """
+
+    alphabet = _UPPERCASE if text[0].isupper() else _LOWERCASE
+
+    index = len(text)
+    while index and text[index - 1] in alphabet:
+        index -= 1
+
+    start = ord('A') if alphabet is _UPPERCASE else ord('a')
+
+    return text[:index], text[index:], start
+
+
+def _shift_characters(text: str, step: int) -> str:
+    """Increment or decrement a text one character at a time, carrying from the end
+
+    Args:
+        text (str): The text to shift
+        step (int): 1 to increment, -1 to decrement
+
+    Returns:
+        str: The shifted text
+
+    Note:
+        Every character is shifted by its code point, letters or not, with the
+        case of the first character deciding where the carry wraps
+    """
+
+    characters = list(text)
+    is_upper = characters[0].isupper()
+    first, last = ('A', 'Z') if is_upper else ('a', 'z')
+    limit, reset = (last, first) if step > 0 else (first, last)
+
+    index = len(characters) - 1
+    while index >= 0:
+        if characters[index] != limit:
+            characters[index] = chr(ord(characters[index]) + step)
+            return ''.join(characters)
+
+        characters[index] = reset
+        index -= 1
+
+    # Every character wrapped, the sequence grows or shrinks by one letter
+    if step > 0:
+        return first + ''.join(characters)
+
+    return ''.join(characters[1:])
+
+
+def _shift_letters(text: str, step: int) -> str:
+    """Increment or decrement the trailing letters of a text as a bijective base-26
+    number, leaving the rest of the text untouched
+
+    Args:
+        text (str): The text to shift
+        step (int): 1 to increment, -1 to decrement
+
+    Returns:
+        str: The shifted text
+
+    Note:
+        A carry or borrow that would reach the prefix falls back to the
+        character by character shift, so the result never changes
+    """
+
+    prefix, letters, start = _split_trailing_letters(text)
+
+    if letters:
+        shifted = _number_to_letters(_letters_to_number(letters, start) + step, start)
+        if not prefix or len(shifted) == len(letters):
+            return prefix + shifted
+
+    return _shift_characters(text, step)
+
+
 def increment_character(text: str) -> str:
     """Increment a letter sequence in a manner similar to Excel column naming
 
@@ -687,11 +1022,16 @@ def increment_character(text: str) -> str:
     - Handles cases like 'ZZ' → 'AAA' and 'zz' → 'aaa'
 
     Args:
-        text (str): A text containing only letters ('A'-'Z' or 'a'-'z')
+        text (str): A text ending with letters ('A'-'Z' or 'a'-'z')
 
     Returns:
         str: The incremented letter sequence
 
+    Note:
+        The trailing letters of the case of the first character are incremented
+        as a whole, a carry reaching the rest of the text shifts it one
+        character at a time as it always has
+
     Examples:
         >>> increment_character('A')
         'B'
@@ -701,25 +1041,11 @@ def increment_character(text: str) -> str:
         'ab'
         >>> increment_character('AZ')
         'BA'
+        >>> increment_character('spineA')
+        'spineB'
     """
 
-    # Convert string to list for mutability
-    text = list(text)
-    # Check if the input is uppercase or lowercase
-    is_upper = text[0].isupper()
-    start_char = 'A' if is_upper else 'a'
-    end_char = 'Z' if is_upper else 'z'
-    # Start from the last character
-    i = len(text) - 1
-    while i >= 0:
-        if text[i] != end_char:
-            text[i] = chr(ord(text[i]) + 1)  # Increment character
-            return ''.join(text)
-        else:
-            text[i] = start_char  # Reset current position to start character
-            i -= 1
-    # Prepend 'A' or 'a' if all characters were 'Z' or 'z'
-    return start_char + ''.join(text)
+    return _shift_letters(text, 1)
 
 
 def increment_digit(text: str, digits: int = None) -> str:
@@ -750,14 +1076,13 @@ def increment_digit(text: str, digits: int = None) -> str:
     if not digits:
         digits = 2
     # Get the last number in the string
-    match = re.search(r'(\d+)$', text)
-    if match:
-        # Get the current number, increment it, and pad it
-        current_number = match.group(1)
-        incremented_number = str(int(current_number) + 1).zfill(digits)
-        return text[:match.start()] + incremented_number
+    head, current_number = _split_last_number(text)
+    if current_number:
+        # Increment the current number and pad it
+        incremented_number = f'{int(current_number) + 1:0{digits}d}'
+        return head + incremented_number
 
-    return text + "1".zfill(digits)
+    return f'{text}{1:0{digits}d}'
 
 
 def add_suffix(text: str, suffix: str, separator: str = '_') -> str:
@@ -782,8 +1107,8 @@ def add_suffix(text: str, suffix: str, separator: str = '_') -> str:
         'name_'
     """
 
-    text = to_camel_case(text=text)
-    suffix = to_camel_case(text=suffix)
+    text = to_camel_case(text)
+    suffix = to_camel_case(suffix)
 
     return f"{text}{separator}{suffix}"
 
@@ -810,8 +1135,8 @@ def add_prefix(text: str, prefix: str, separator: str = '_') -> str:
         '_name'
     """
 
-    text = to_camel_case(text=text)
-    prefix = to_camel_case(text=prefix)
+    text = to_camel_case(text)
+    prefix = to_camel_case(prefix)
 
     return f"{prefix}{separator}{text}"
 
@@ -837,7 +1162,7 @@ def add_text(text: str, text_to_add: str = '') -> str:
         'name123'
     """
     if text_to_add:
-        text_to_add = to_pascal_case(text=text_to_add)
+        text_to_add = to_pascal_case(text_to_add)
 
     return f'{text}{text_to_add}'
 
@@ -850,11 +1175,16 @@ def decrement_character(text: str) -> str:
     - Handles cases like 'AAA' → 'ZZ' and 'aaa' → 'zz'
 
     Args:
-        text (str): A text containing only letters ('A'-'Z' or 'a'-'z')
+        text (str): A text ending with letters ('A'-'Z' or 'a'-'z')
 
     Returns:
         str: The decremented letter sequence
 
+    Note:
+        The trailing letters of the case of the first character are decremented
+        as a whole, a carry reaching the rest of the text shifts it one
+        character at a time as it always has
+
     Examples:
         >>> decrement_character('B')
         'A'
@@ -866,25 +1196,11 @@ def decrement_character(text: str) -> str:
         'AZ'
         >>> decrement_character('aaa')
         'zz'
+        >>> decrement_character('arm_L')
+        'arm_K'
     """
 
-    # Convert string to list for mutability
-    text = list(text)
-    # Check if the input is uppercase or lowercase
-    is_upper = text[0].isupper()
-    start_char = 'A' if is_upper else 'a'
-    end_char = 'Z' if is_upper else 'z'
-    # Start from the last character
-    i = len(text) - 1
-    while i >= 0:
-        if text[i] != start_char:
-            text[i] = chr(ord(text[i]) - 1)  # Decrement character
-            return ''.join(text)
-        else:
-            text[i] = end_char  # Reset current position to end character
-            i -= 1
-    # Remove one character from the start if all were 'A' or 'a'
-    return ''.join(text[1:])
+    return _shift_letters(text, -1)
 
 
 def decrement_digit(text: str) -> str:
@@ -912,15 +1228,193 @@ def decrement_digit(text: str) -> str:
     """
 
     # Get the last number in the string
-    match = re.search(r'(\d+)$', text)
-    if match:
-        # Get the current number, decrement it, and pad it
-        current_number = match.group(1)
+    head, current_number = _split_last_number(text)
+    if current_number:
+        # Decrement the current number and pad it
         if int(current_number) == 0 or int(current_number) == 1:
-            return text[:match.start()]
+            return head
         digits = len(current_number)
-        decremented_number = str(int(current_number) - 1).zfill(digits)
+        decremented_number = f'{int(current_number) - 1:0{digits}d}'
 
-        return text[:match.start()] + decremented_number
+        return head + decremented_number
 
     return text
+
+
+# BATCH
+def is_character_in_many(texts: list[str], character: str = '_') -> list[bool]:
+    """Validate if a character is in each text of a list
+
+    Args:
+        texts (list[str]): Texts to look for
+        character (str): Character to validate. Defaults to '_'
+
+    Returns:
+        list[bool]: True for each text containing the character, False otherwise
+
+    Example:
+        >>> is_character_in_many(['Name_of_variable', 'NameOfVariable'], '_')
+        [True, False]
+    """
+
+    return [character in text for text in texts]
+
+
+def get_case_style_many(texts: list[str]) -> list[str]:
+    """Determine the naming style of each text of a list
+
+    Args:
+        texts (list[str]): The texts to determinate style.
+
+    Returns:
+        list[str]: The naming style of each text
+
+    Example:
+        >>> get_case_style_many(['nameOfVariable', 'name_of_variable'])
+        ['camelCase', 'snake_case']
+    """
+
+    case_style = get_case_style
+
+    return [case_style(text) for text in texts]
+
+
+def to_camel_case_many(texts: list[str], delete_numbers: bool = False) -> list[str]:
+    """Convert each text of a list to camelCase
+
+    Args:
+        texts (list[str]): Texts to convert to camelCase
+        delete_numbers (bool): Remove numbers from the texts. Defaults to False
+
+    Returns:
+        list[str]: camelCase strings
+
+    Example:
+        >>> to_camel_case_many(['name_of_variable', 'NameOfVariable'])
+        ['nameOfVariable', 'nameOfVariable']
+    """
+
+    camel_case = to_camel_case
+
+    return [camel_case(text, delete_numbers) for text in texts]
+
+
+def to_pascal_case_many(texts: list[str], delete_numbers: bool = False) -> list[str]:
+    """Convert each text of a list to PascalCase
+
+    Args:
+        texts (list[str]): Texts to convert to PascalCase
+        delete_numbers (bool): Remove numbers from the texts. Defaults to False
+
+    Returns:
+        list[str]: PascalCase strings
+
+    Example:
+        >>> to_pascal_case_many(['name_of_variable', 'nameOfVariable'])
+        ['NameOfVariable', 'NameOfVariable']
+    """
+
+    pascal_case = to_pascal_case
+
+    return [pascal_case(text, delete_numbers) for text in texts]
+
+
+def to_snake_case_many(texts: list[str], delete_numbers: bool = False) -> list[str]:
+    """Convert each text of a list to snake_case
+
+    Args:
+        texts (list[str]): Texts to convert to snake_case
+        delete_numbers (bool): Remove numbers from the texts. Defaults to False
+
+    Returns:
+        list[str]: snake_case strings
+
+    Example:
+        >>> to_snake_case_many(['nameOfVariable', 'name-of-variable'])
+        ['name_of_variable', 'name_of_variable']
+    """
+
+    snake_case = to_snake_case
+
+    return [snake_case(text, delete_numbers) for text in texts]
+
+
+def to_kebab_case_many(texts: list[str], delete_numbers: bool = False) -> list[str]:
+    """Convert each text of a list to kebab-case
+
+    Args:
+        texts (list[str]): Texts to convert to kebab-case
+        delete_numbers (bool): Remove numbers from the texts. Defaults to False
+
+    Returns:
+        list[str]: kebab-case strings
+
+    Example:
+        >>> to_kebab_case_many(['nameOfVariable', 'name_of_variable'])
+        ['name-of-variable', 'name-of-variable']
+    """
+
+    kebab_case = to_kebab_case
+
+    return [kebab_case(text, delete_numbers) for text in texts]
+
+
+def add_suffix_many(texts: list[str], suffix: str, separator: str = '_') -> list[str]:
+    """Add a suffix to each text of a list using a separator
+
+    Args:
+        texts (list[str]): Texts to add the suffix to
+        suffix (str): The suffix to add
+        separator (str): The separator to use. Defaults to '_'
+
+    Returns:
+        list[str]: Texts with the suffix added
+
+    Example:
+        >>> add_suffix_many(['arm', 'leg_upper'], 'jnt')
+        ['arm_jnt', 'legUpper_jnt']
+    """
+
+    # The suffix is shared, so it is converted once for the whole list
+    ending = f"{separator}{to_camel_case(suffix)}"
+    camel_case = to_camel_case
+
+    return [camel_case(text) + ending for text in texts]
+
+
+def add_prefix_many(texts: list[str], prefix: str, separator: str = '_') -> list[str]:
+    """Add a prefix to each text of a list using a separator
+
+    Args:
+        texts (list[str]): Texts to add the prefix to
+        prefix (str): The prefix to add
+        separator (str): The separator to use. Defaults to '_'
+
+    Returns:
+        list[str]: Texts with the prefix added
+
+    Example:
+        >>> add_prefix_many(['arm', 'leg_upper'], 'L')
+        ['l_arm', 'l_legUpper']
+    """
+
+    # The prefix is shared, so it is converted once for the whole list
+    beginning = f"{to_camel_case(prefix)}{separator}"
+    camel_case = to_camel_case
+
+    return [beginning + camel_case(text) for text in texts]
+
+
+# CACHES
+def clear_naming_caches() -> None:
+    """Clear the cached results of the naming functions
+
+    Example:
+        >>> clear_naming_caches()
+    """
+
+    for function in (is_camel_case, is_pascal_case, is_snake_case, is_kebab_case,
+                     get_case_style, _split_words, to_camel_case, to_pascal_case,
+                     to_snake_case, to_kebab_case, _format_value_cached,
+                     convert_text_to_value):
+        function.cache_clear()
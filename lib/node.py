@@ -3,9 +3,59 @@ This module provides a 'Node' class that represents a node in a Maya scene.
 It includes methods for creating, querying, modifying, and deleting nodes
 """
 
+import contextlib
+
 from maya import cmds
+from maya.api import OpenMaya as om
 from craftRig.lib import naming
-from craftRig.solutions import connections
+from craftRig.solutions.connections import get_input_connection as _get_input_connection
+
+_SELECTION = om.MSelectionList()
+_FROZEN = False
+_EMPTY = ()
+
+
+def _select(name: str) -> om.MSelectionList:
+    """Fill the shared selection list with a node
+
+    Args:
+        name (str): Name of the node
+
+    Returns:
+        MSelectionList: The selection list holding the node, None if it does not exist
+    """
+
+    _SELECTION.clear()
+
+    try:
+        _SELECTION.add(name)
+    except RuntimeError:
+        return None
+
+    return _SELECTION
+
+
+@contextlib.contextmanager
+def frozen_scene() -> None:
+    """Skip the existence checks of every Node while the block runs
+
+    Note:
+        The nodes used inside the block are assumed to exist, a missing node
+        raises a RuntimeError from Maya instead of returning False
+
+    Example:
+    >>> with frozen_scene():
+    ...     Node('pCube1').lock_node()
+    """
+
+    global _FROZEN
+    frozen = _FROZEN
+    _FROZEN = True
+
+    try:
+        yield
+    finally:
+        _FROZEN = frozen
 
 
 class Node(object):
@@ -13,6 +63,9 @@ class Node(object):
     Node class
     """
 
+    __slots__ = ('name', 'node_type', '_handle', '_attr_intermediate',
+                 '_exists_cached', '_pending_name')
+
     def __init__(self, name: str, node_type: str = '') -> None:
         """Node class constructor
 
@@ -23,6 +76,10 @@ class Node(object):
 
         self.name = name
         self.node_type = node_type
+        self._handle = None
+        self._attr_intermediate = f'{name}.intermediateObject'
+        self._exists_cached = None
+        self._pending_name = None
 
     @classmethod
     def from_string(cls, text: str) -> 'Node':
@@ -55,12 +112,166 @@ class Node(object):
         'pCube1'
         """
 
-        selection = cmds.ls(sl=True) or []
+        selection = om.MGlobal.getActiveSelectionList()
 
-        if not selection:
+        if selection.isEmpty():
             return None
 
-        return Node.from_string(text=selection[0])
+        return Node(name=selection.getSelectionStrings(0)[0],
+                    node_type=om.MFnDependencyNode(selection.getDependNode(0)).typeName)
+
+    @classmethod
+    def bulk_create(cls, nodes: list[tuple[str, str]]) -> list['Node']:
+        """Create many nodes in the scene with a single modifier
+
+        Args:
+            nodes (list[tuple[str, str]]): The name and node type of each node
+
+        Returns:
+            list[Node]: Node objects of the created nodes
+
+        Note:
+            Names that already exist in the scene or that repeat an earlier
+            name of the list are skipped
+            A shape type is created with a parent transform, which gets the name
+            and is the node returned, with its type read from the scene
+            The nodes are created outside the Maya undo queue, unlike
+            create_node, so they cannot be undone
+
+        Example:
+            >>> nodes = Node.bulk_create([('root', 'transform'), ('sum', 'plusMinusAverage')])
+            >>> [node.name for node in nodes]
+            ['root', 'sum']
+        """
+
+        dag_modifier = om.MDagModifier()
+        dg_modifier = om.MDGModifier()
+        is_dag_type = {}
+        names = set()
+        created = []
+
+        for name, node_type in nodes:
+            if name in names or _select(name) is not None:
+                continue
+
+            names.add(name)
+
+            is_dag = is_dag_type.get(node_type)
+            if is_dag is None:
+                is_dag = is_dag_type[node_type] = 'dagNode' in cmds.nodeType(
+                    node_type, isTypeName=True, inherited=True)
+
+            modifier = dag_modifier if is_dag else dg_modifier
+            mobject = modifier.createNode(node_type)
+            modifier.renameNode(mobject, name)
+            created.append((cls(name=name), om.MObjectHandle(mobject)))
+
+        dg_modifier.doIt()
+        dag_modifier.doIt()
+
+        for new_node, handle in created:
+            dependency_node = om.MFnDependencyNode(handle.object())
+            new_node.name = dependency_node.name()
+            new_node.node_type = dependency_node.typeName
+            new_node._attr_intermediate = f'{new_node.name}.intermediateObject'
+
+        return [new_node for new_node, _ in created]
+
+    # HELPERS
+    @contextlib.contextmanager
+    def _exists_scope(self) -> bool:
+        """Check if the node exists once and reuse the result inside the block
+
+        Yields:
+            bool: True if the node exists, False otherwise
+
+        Note:
+            A nested scope reuses the result of the outermost one
+
+        Example:
+        >>> node = Node('pCube1')
+        >>> with node._exists_scope() as exists:
+        ...     exists
+        True
+        """
+
+        if self._exists_cached is not None:
+            yield self._exists_cached
+            return
+
+        self._exists_cached = self.node_exists()
+
+        try:
+            yield self._exists_cached
+        finally:
+            self._exists_cached = None
+
+    def _mobj(self) -> om.MObject:
+        """Get the MObject of the node from its cached MObjectHandle
+
+        Returns:
+            om.MObject: The MObject of the node, None if it does not exist
+
+        Note:
+            The name is only resolved when the handle is not valid, the handle
+            follows the node through renames and the name is updated to match
+        """
+
+        handle = self._handle
+        if handle is None or not handle.isValid():
+            selection = _select(self.name)
+            if selection is None:
+                self._handle = None
+                return None
+
+            handle = self._handle = om.MObjectHandle(selection.getDependNode(0))
+            return handle.object()
+
+        mobject = handle.object()
+        self._sync_name(mobject)
+        return mobject
+
+    def _sync_name(self, mobject: om.MObject) -> None:
+        """Update the name of the node after a rename made outside of this object
+
+        Args:
+            mobject (om.MObject): The MObject of the node
+
+        Note:
+            Only the leaf name is compared, DAG nodes take their shortest
+            unique path when they are renamed
+        """
+
+        name = om.MFnDependencyNode(mobject).name()
+        if name == self.name.rpartition('|')[2]:
+            return
+
+        if mobject.hasFn(om.MFn.kDagNode):
+            name = om.MDagPath.getAPathTo(mobject).partialPathName()
+
+        self.name = name
+        self._attr_intermediate = f'{name}.intermediateObject'
+
+    def _apply_name_transform(self, transform, *args, **kwargs) -> str:
+        """Rename the node with the result of a naming function
+
+        Args:
+            transform (function): Naming function that receives the current name
+                                  and returns the new one
+            args: Extra positional arguments for the naming function
+            kwargs: Extra keyword arguments for the naming function
+
+        Returns:
+            str: The new name of the node.
+
+        Note:
+            Inside a deferred_rename block the pending name is transformed instead
+            of the name of the node
+        """
+
+        name = self.name if self._pending_name is None else self._pending_name
+
+        return self.rename_node(transform(name, *args, **kwargs))
 
     # VALIDATORS
     def node_exists(self) -> bool:
@@ -75,10 +286,13 @@ class Node(object):
         True
         """
 
-        if not cmds.objExists(self.name):
-            return False
+        if _FROZEN:
+            return True
 
-        return True
+        if self._exists_cached is not None:
+            return self._exists_cached
+
+        return self._mobj() is not None
 
     def is_intermediate(self) -> bool:
         """Check if the node is an intermediate object.
@@ -92,10 +306,11 @@ class Node(object):
             False
         """
 
-        if not self.node_exists():
+        mobject = self._mobj()
+        if mobject is None:
             return False
 
-        return cmds.getAttr(f'{self.name}.intermediateObject')
+        return om.MFnDependencyNode(mobject).findPlug('intermediateObject', False).asBool()
 
     def is_node_locked(self) -> bool:
         """Check if the node is locked.
@@ -109,10 +324,11 @@ class Node(object):
             True
         """
 
-        if not self.node_exists():
+        mobject = self._mobj()
+        if mobject is None:
             return False
 
-        return cmds.lockNode(self.name, True, l=True)[0]
+        return om.MFnDependencyNode(mobject).isLocked
 
     def is_reference(self) -> bool:
         """Check if the node is part of a reference.
@@ -126,17 +342,18 @@ class Node(object):
             False
         """
 
-        if not self.node_exists():
+        mobject = self._mobj()
+        if mobject is None:
             return False
 
-        return cmds.referenceQuery(self.name, inr=True)
+        return om.MFnDependencyNode(mobject).isFromReferencedFile
 
     # GETTERS
     def get_full_path(self) -> str:
         """Get the full path of the node.
 
         Returns:
-            str: The full path of the node.
+            str: The full path of the node, None if it does not exist.
 
         Example:
         >>> node = Node('pCube1')
@@ -144,16 +361,23 @@ class Node(object):
         '|pCube1'
         """
 
-        if not self.node_exists():
-            return False
+        mobject = self._mobj()
+        if mobject is None:
+            return None
 
-        return cmds.ls(self.name, l=True)[0]
+        if mobject.hasFn(om.MFn.kDagNode):
+            return om.MDagPath.getAPathTo(mobject).fullPathName()
+
+        return om.MFnDependencyNode(mobject).name()
 
     def get_node_type(self) -> str:
         """Get the node type of the node
 
         Returns:
-            str: The node type of the node
+            str: The node type of the node, None if it does not exist
+
+        Note:
+            The type is read from the scene once and kept in node_type
 
         Example:
         >>> node = Node('pCube1')
@@ -161,10 +385,14 @@ class Node(object):
         'transform'
         """
 
-        if self.node_exists():
-            return cmds.nodeType(self.name)
+        mobject = self._mobj()
+        if mobject is None:
+            return None
 
-        return None
+        if not self.node_type:
+            self.node_type = om.MFnDependencyNode(mobject).typeName
+
+        return self.node_type
 
     def get_history(self, **kwargs) -> list[str]:
         """Get the history of the node.
@@ -172,6 +400,10 @@ class Node(object):
         Returns:
             List[str]: A list of history node names.
 
+        Note:
+            Extra keyword arguments are passed to cmds.listHistory, pruneDagObjects
+            or levels can be used to shorten the history at the source
+
         Example:
             >>> node = Node("pCube1")
             >>> node.get_history()
@@ -180,7 +412,8 @@ class Node(object):
         if not self.node_exists():
             return []
 
-        return [x for x in cmds.listHistory(self.name, **kwargs) if not self.name in x] or []
+        name = self.name
+        return [x for x in cmds.listHistory(name, **kwargs) or _EMPTY if x != name]
 
     def get_input_connection(self, attribute_name: str) -> list:
         """Get the source connection of an attribute.
@@ -197,7 +430,7 @@ class Node(object):
             []
         """
 
-        return connections.get_input_connection(node=self.name, attribute_name=attribute_name)
+        return _get_input_connection(node=self.name, attribute_name=attribute_name)
 
     # SETTERS
     def lock_node(self, lock: bool = True) -> bool:
@@ -239,7 +472,7 @@ class Node(object):
         if not self.node_exists():
             return False
 
-        cmds.setAttr(f'{self.name}.intermediateObject', value)
+        cmds.setAttr(self._attr_intermediate, value)
         return True
 
     def duplicate_node(self, new_name: str = "", children: bool = True, **kwargs) -> str:
@@ -262,13 +495,15 @@ class Node(object):
         if not self.node_exists():
             return False
 
-        if not new_name:
-            new_name = self.name
+        if new_name:
+            kwargs['n'] = new_name
 
-        new_node = cmds.duplicate(
-            self.name, n=new_name, po=not children, rc=True, **kwargs)
+        if children:
+            kwargs['rc'] = True
+        else:
+            kwargs['po'] = True
 
-        return new_node[0]
+        return cmds.duplicate(self.name, **kwargs)[0]
 
     # DELETTERS
     def delete_node(self) -> bool:
@@ -277,21 +512,33 @@ class Node(object):
         Returns:
             bool: True if the node was deleted, False otherwise
 
+        Note:
+            A locked node is unlocked first, the unlock and the deletion are
+            grouped in a single undo step
+
         Example:
         >>> node = Node('pCube1')
         >>> node.delete_node()
         True
         """
 
-        if self.node_exists():
+        mobject = self._mobj()
+        if mobject is None:
+            return False
 
-            if self.is_node_locked():
-                self.lock_node(lock=False)
+        path = self.get_full_path()
 
-            cmds.delete(self.name)
-            return True
+        cmds.undoInfo(openChunk=True, chunkName='delete_node')
+        try:
+            if om.MFnDependencyNode(mobject).isLocked:
+                cmds.lockNode(path, lock=False)
 
-        return False
+            cmds.delete(path)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        self.node_type = ''
+        return True
 
     def delete_history(self) -> bool:
         """Delete the history of the node.
@@ -304,9 +551,11 @@ class Node(object):
             >>> node.delete_history()
         """
 
-        if not self.node_exists():
-            return False
-        cmds.delete(self.get_history())
+        with self._exists_scope() as exists:
+            if not exists:
+                return False
+
+            cmds.delete(self.get_history())
 
         return True
 
@@ -326,10 +575,12 @@ class Node(object):
             'test'
         """
 
-        if not self.node_exists():
-            return cmds.createNode(node_type, self.name, **kwargs)
+        if self.node_exists():
+            return None
 
-        return None
+        new_node = cmds.createNode(node_type, self.name, **kwargs)
+        self.node_type = node_type
+        return new_node
 
     # NAMING UTILITIES
     def rename_node(self, new_name: str) -> bool:
@@ -341,19 +592,92 @@ class Node(object):
         Returns:
             bool: True if the node was renamed successfully, False otherwise.
 
+        Note:
+            Renaming the node to its current name does not call Maya
+
         Example:
             >>> node = Node("pCube1")
             >>> node.rename_node("myNewCube")
             True
         """
 
+        if self._pending_name is not None:
+            self._pending_name = new_name
+            return new_name
+
         if not self.node_exists():
             return None
 
+        if new_name == self.name:
+            return new_name
+
         cmds.rename(self.name, new_name)
         self.name = new_name
+        self._attr_intermediate = f'{new_name}.intermediateObject'
         return new_name
 
+    @contextlib.contextmanager
+    def deferred_rename(self) -> 'Node':
+        """Chain several renames inside the block and rename the node once on exit
+
+        Yields:
+            Node: The node itself
+
+        Note:
+            The node keeps its name until the block exits, nested blocks are
+            flushed by the outermost one and nothing is renamed if the block raises
+
+        Example:
+        >>> node = Node('pCube1')
+        >>> with node.deferred_rename():
+        ...     node.add_prefix('L')
+        ...     node.add_suffix('geo')
+        >>> node.name
+        'L_pCube1_geo'
+        """
+
+        if self._pending_name is not None:
+            yield self
+            return
+
+        self._pending_name = self.name
+
+        try:
+            yield self
+        except BaseException:
+            self._pending_name = None
+            raise
+
+        new_name = self._pending_name
+        self._pending_name = None
+
+        if new_name != self.name:
+            self.rename_node(new_name)
+
+    def compose_name(self, *transforms) -> str:
+        """Chain several naming functions and rename the node once with the result
+
+        Args:
+            transforms (function): Naming functions that receive a name and
+                                   return the new one, applied in order
+
+        Returns:
+            str: The new name of the node.
+
+        Example:
+            >>> node = Node("arm")
+            >>> node.compose_name(lambda name: f'L_{name}',
+            ...                   lambda name: naming.add_suffix(name, 'ctrl'))
+            'L_arm_ctrl'
+        """
+
+        name = self.name if self._pending_name is None else self._pending_name
+
+        for transform in transforms:
+            name = transform(name)
+
+        return self.rename_node(name)
+
     def add_prefix(self, prefix: str, separator: str = '_') -> str:
         """Add a prefix to the node name using a separator
 
@@ -370,10 +694,7 @@ class Node(object):
             'myPrefix_pCube1'
         """
 
-        new_name = naming.add_prefix(
-            text=self.name, prefix=prefix, separator=separator)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.add_prefix, prefix, separator)
 
     def add_suffix(self, suffix: str, separator: str = '_') -> str:
         """Add a suffix to the node name using a separator
@@ -391,9 +712,7 @@ class Node(object):
             'pCube1_mySuffix'
         """
 
-        new_name = naming.add_suffix(self.name, suffix, separator)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.add_suffix, suffix, separator)
 
     def add_text(self, text: str) -> str:
         """Add text to the node name in PascalCase
@@ -410,9 +729,7 @@ class Node(object):
             'pCube1Test'
         """
 
-        new_name = naming.add_text(text=self.name, text_to_add=text)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.add_text, text)
 
     def increment_digit(self, digits: int = None) -> str:
         """Increment the last number in the node.
@@ -430,9 +747,7 @@ class Node(object):
             'pCube002'
         """
 
-        new_name = naming.increment_digit(self.name, digits=digits)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.increment_digit, digits)
 
     def decrement_digit(self) -> str:
         """Decrement the last number in the node.
@@ -450,9 +765,7 @@ class Node(object):
             'pCube'
         """
 
-        new_name = naming.decrement_digit(text=self.name)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.decrement_digit)
 
     def increment_character(self):
         """
@@ -467,9 +780,7 @@ class Node(object):
             'tess'
         """
 
-        new_name = naming.increment_character(text=self.name)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.increment_character)
 
     def decrement_character(self):
         """Decrement a letter sequence in a manner similar to Excel column naming
@@ -482,6 +793,4 @@ class Node(object):
             >>> node.rename_with_decrement_character()
         """
 
-        new_name = naming.decrement_character(text=self.name)
-
-        return self.rename_node(new_name)
+        return self._apply_name_transform(naming.decrement_character)
@@ -0,0 +1,252 @@
+"""
+This module provides a 'NodeSet' class that represents a group of nodes in a Maya scene.
+It runs one Maya command for the whole group instead of one command per node
+"""
+
+from maya import cmds
+from maya.api import OpenMaya as om
+from craftRig.lib import node
+
+
+class NodeSet(object):
+    """
+    NodeSet class
+    """
+
+    __slots__ = ('names', 'node_types')
+
+    def __init__(self, names: list[str], node_types: list[str] = None) -> None:
+        """NodeSet class constructor
+
+        Args:
+            names (list[str]): The names of the nodes
+            node_types (list[str], optional): The type of each node, in the same
+                                              order as the names. Defaults to None.
+        """
+
+        self.names = list(names)
+        self.node_types = list(node_types) if node_types else [''] * len(self.names)
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the set
+
+        Returns:
+            int: The number of nodes
+        """
+
+        return len(self.names)
+
+    @classmethod
+    def from_nodes(cls, nodes: list[node.Node]) -> 'NodeSet':
+        """Create a NodeSet object from Node objects
+
+        Args:
+            nodes (list[Node]): Node objects
+
+        Returns:
+            NodeSet: NodeSet object
+
+        Example:
+        >>> node_set = NodeSet.from_nodes([Node('pCube1'), Node('pCube2')])
+        >>> node_set.names
+        ['pCube1', 'pCube2']
+        """
+
+        return cls(names=[item.name for item in nodes],
+                   node_types=[item.node_type for item in nodes])
+
+    @classmethod
+    def from_selection(cls) -> 'NodeSet':
+        """Create a NodeSet object from the selection
+
+        Returns:
+            NodeSet: NodeSet object
+
+        Example:
+        >>> node_set = NodeSet.from_selection()
+        >>> node_set.names
+        ['pCube1', 'pCube2']
+        """
+
+        return cls(names=om.MGlobal.getActiveSelectionList().getSelectionStrings())
+
+    # HELPERS
+    def _get_existing(self) -> list[str]:
+        """Get the names of the nodes that exist in the scene
+
+        Returns:
+            list[str]: The names of the existing nodes
+        """
+
+        return cmds.ls(self.names) if self.names else []
+
+    # VALIDATORS
+    def exists_mask(self) -> list[bool]:
+        """Check which nodes exist in the scene
+
+        Returns:
+            list[bool]: True for each node that exists, False otherwise,
+                        in the same order as the names
+
+        Note:
+            Names must be unique short names or full paths
+
+        Example:
+        >>> node_set = NodeSet(['pCube1', 'missing'])
+        >>> node_set.exists_mask()
+        [True, False]
+        """
+
+        if not self.names:
+            return []
+
+        existing = set(cmds.ls(self.names))
+        existing.update(cmds.ls(self.names, long=True))
+
+        return [name in existing for name in self.names]
+
+    # GETTERS
+    def get_node_types(self) -> list[str]:
+        """Get the node type of every node
+
+        Returns:
+            list[str]: The node types, one per name in the same order,
+                       None for the nodes that do not exist
+
+        Note:
+            A type already known is not queried again, only the existence
+            of its node is checked
+
+        Example:
+        >>> node_set = NodeSet(['pCube1', 'missing', 'pCubeShape1'])
+        >>> node_set.get_node_types()
+        ['transform', None, 'mesh']
+        """
+
+        selection = om.MSelectionList()
+        node_types = []
+
+        for name, node_type in zip(self.names, self.node_types):
+            selection.clear()
+
+            try:
+                selection.add(name)
+            except RuntimeError:
+                node_types.append(None)
+                continue
+
+            node_types.append(
+                node_type or om.MFnDependencyNode(selection.getDependNode(0)).typeName)
+
+        return node_types
+
+    # SETTERS
+    def lock(self, lock: bool = True) -> bool:
+        """Lock or unlock every existing node.
+
+        Args:
+            lock (bool, optional): True to lock the nodes, False to unlock. Defaults to True.
+
+        Returns:
+            bool: True if any node was locked or unlocked, False otherwise.
+
+        Example:
+            >>> node_set = NodeSet(['pCube1', 'pCube2'])
+            >>> node_set.lock(False)
+            True
+        """
+
+        names = self._get_existing()
+        if not names:
+            return False
+
+        cmds.lockNode(names, lock=lock)
+        return True
+
+    def set_intermediate(self, value: bool = True) -> bool:
+        """Set or unset the intermediate state of every existing node.
+
+        Args:
+            value (bool, optional): True to set intermediate, False to unset. Defaults to True.
+
+        Returns:
+            bool: True if the intermediate state of any node was set, False otherwise.
+
+        Note:
+            The changes are grouped in a single undo step
+
+        Example:
+            >>> node_set = NodeSet(['pCubeShape1', 'pCubeShape2'])
+            >>> node_set.set_intermediate(False)
+            True
+        """
+
+        names = self._get_existing()
+        if not names:
+            return False
+
+        cmds.undoInfo(openChunk=True, chunkName='set_intermediate')
+        try:
+            for name in names:
+                cmds.setAttr(f'{name}.intermediateObject', value)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return True
+
+    # DELETTERS
+    def delete(self) -> bool:
+        """Delete every existing node, unlocking the locked ones first
+
+        Returns:
+            bool: True if any node was deleted, False otherwise
+
+        Note:
+            The unlock and the deletion are grouped in a single undo step
+
+        Example:
+        >>> node_set = NodeSet(['pCube1', 'pCube2'])
+        >>> node_set.delete()
+        True
+        """
+
+        names = self._get_existing()
+        if not names:
+            return False
+
+        locked = [name for name, is_locked in
+                  zip(names, cmds.lockNode(names, query=True, lock=True)) if is_locked]
+
+        cmds.undoInfo(openChunk=True, chunkName='delete')
+        try:
+            if locked:
+                cmds.lockNode(locked, lock=False)
+
+            cmds.delete(names)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        return True
+
+    def delete_history(self) -> bool:
+        """Delete the history of every existing node.
+
+        Returns:
+            bool: True if the history was deleted, False otherwise.
+
+        Example:
+            >>> node_set = NodeSet(['pCube1', 'pCube2'])
+            >>> node_set.delete_history()
+            True
+        """
+
+        names = self._get_existing()
+        if not names:
+            return False
+
+        own = set(names)
+        history = [x for x in cmds.listHistory(names) or [] if x not in own]
+        if history:
+            cmds.delete(history)
+
+        return True
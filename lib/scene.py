@@ -1,15 +1,22 @@
 """
 This module provides functionality for interacting with and managing scenes in Autodesk Maya.
 """
+import contextlib
+
 # Maya imports
 from maya import cmds
 
+_DEFAULT_NAMESPACES = frozenset(('UI', 'shared'))
+_SUSPEND_DEPTH = 0
+
 
 class Scene(object):
     """
     Scene class
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_scene_namespaces() -> list:
         """Get a list of namespaces in the Maya scene, excluding default namespaces "UI", "shared".
@@ -18,9 +25,45 @@ class Scene(object):
             list: A list of namespaces in the Maya scene, 
         """
 
-        namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True)
+        namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True) or ()
+
+        return [ns for ns in namespaces if ns not in _DEFAULT_NAMESPACES]
+
+    @staticmethod
+    @contextlib.contextmanager
+    def suspend_evaluation() -> None:
+        """Switch the evaluation manager off and suspend the viewport refresh
+        while the block runs, restoring both on exit
+
+        Note:
+            Edits made inside the block defer their dirty propagation until
+            the evaluation manager is restored
+            Nested blocks are left to the outermost one, which alone suspends
+            and restores the evaluation
+
+        Example:
+        >>> with Scene.suspend_evaluation():
+        ...     cmds.setAttr('pCube1.translateX', 1.0)
+        """
+
+        global _SUSPEND_DEPTH
+
+        if _SUSPEND_DEPTH:
+            _SUSPEND_DEPTH += 1
+            try:
+                yield
+            finally:
+                _SUSPEND_DEPTH -= 1
+            return
 
-        filtered_namespaces = [
-            ns for ns in namespaces if ns not in ["UI", "shared"]]
+        mode = cmds.evaluationManager(query=True, mode=True)[0]
+        cmds.evaluationManager(mode='off')
+        cmds.refresh(suspend=True)
+        _SUSPEND_DEPTH = 1
 
-        return filtered_namespaces or []
+        try:
+            yield
+        finally:
+            _SUSPEND_DEPTH = 0
+            cmds.refresh(suspend=False)
+            cmds.evaluationManager(mode=mode)
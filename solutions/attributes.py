@@ -2,7 +2,208 @@
 This module provides functions for managing and manipulating attributes of nodes
 """
 
+import contextlib
+import functools
+import math
+import re
+
 from maya import cmds
+from maya import mel
+from maya.api import OpenMaya as om
+from craftRig.lib import scene
+
+_CACHE_SIZE = 8192
+_EMPTY = ()
+_TOLERANCE = 1e-9
+_MEL_SAFE_RE = re.compile(r'[\w|:.\[\]]+')
+_ATTRIBUTE_TYPES = {}
+_DEFAULT_VALUES = {}
+_SELECTION = om.MSelectionList()
+_TYPE_KWARGS = {'float': {'attributeType': 'float'},
+                'int': {'attributeType': 'long'},
+                'bool': {'attributeType': 'bool'},
+                'matrix': {'attributeType': 'matrix'},
+                'string': {'dataType': 'string'},
+                'message': {'attributeType': 'message'}}
+
+
+# HELPERS
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _plug_name(node: str, attribute: str) -> str:
+    """Get the name of the plug of an attribute, built once per pair
+
+    Args:
+        node (str): Name of the node
+        attribute (str): Name of the attribute
+
+    Returns:
+        str: The plug name, 'node.attribute'
+    """
+
+    return f'{node}.{attribute}'
+
+
+@functools.lru_cache(maxsize=256)
+def _enum_name(states: tuple[str]) -> str:
+    """Get the enumName flag of a set of enum states, validated and joined once
+
+    Args:
+        states (tuple[str]): The enum states
+
+    Returns:
+        str: The states joined by ':'
+    """
+
+    if not states or not all(isinstance(state, str) and state for state in states):
+        raise ValueError(f'Enum states must be non-empty strings, got {states}')
+
+    return ':'.join(states)
+
+
+def _get_plug(node: str, attribute: str) -> om.MPlug:
+    """Get the MPlug of an attribute through a shared selection list
+
+    Args:
+        node (str): Name of the node
+        attribute (str): Name of the attribute
+
+    Returns:
+        om.MPlug: The plug of the attribute, None if it does not exist
+    """
+
+    _SELECTION.clear()
+
+    try:
+        _SELECTION.add(_plug_name(node, attribute))
+        return _SELECTION.getPlug(0)
+    except (RuntimeError, TypeError):
+        return None
+
+
+def _static_key(plug: om.MPlug, attribute: str) -> tuple[str, str]:
+    """Get the cache key of a static attribute, shared by every node of its type
+
+    Args:
+        plug (om.MPlug): The plug of the attribute
+        attribute (str): Name of the attribute
+
+    Returns:
+        tuple[str, str]: The node type and the attribute name, None for a
+                         dynamic attribute, which can be deleted or edited
+    """
+
+    if plug.isDynamic:
+        return None
+
+    return om.MFnDependencyNode(plug.node()).typeName, attribute
+
+
+@contextlib.contextmanager
+def _undo_chunk(name: str) -> None:
+    """Group every command run inside the block into a single undo step
+
+    Args:
+        name (str): Name of the undo chunk
+    """
+
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def _is_same_value(current: any, value: any) -> bool:
+    """Check if an attribute value already matches a new one, floats within a tolerance
+
+    Args:
+        current (any): The current value of the attribute
+        value (any): The new value
+
+    Returns:
+        bool: True if both values match
+    """
+
+    if isinstance(current, float) or isinstance(value, float):
+        try:
+            return math.isclose(current, value, abs_tol=_TOLERANCE)
+        except TypeError:
+            return False
+
+    return current == value
+
+
+def _value_flags(min_value: float = None,
+                 max_value: float = None,
+                 default_value: float = None) -> dict:
+    """Get the addAttr flags of the numeric limits that are set
+
+    Args:
+        min_value (float, optional): Minimum value. Defaults to None.
+        max_value (float, optional): Maximum value. Defaults to None.
+        default_value (float, optional): Default value. Defaults to None.
+
+    Returns:
+        dict: The minValue, maxValue and defaultValue flags that are not None
+    """
+
+    flags = {}
+    if min_value is not None:
+        flags['minValue'] = min_value
+    if max_value is not None:
+        flags['maxValue'] = max_value
+    if default_value is not None:
+        flags['defaultValue'] = default_value
+
+    return flags
+
+
+def _lock_attribute_unchecked(node: str, attribute: str, lock: bool = True) -> None:
+    """Lock the attribute given, without checking that it exists
+
+    Args:
+        node (str): Name of the node
+        attribute (str): Name of the attribute
+        lock (bool, optional): True to lock the attribute. Defaults to True.
+    """
+
+    cmds.setAttr(_plug_name(node, attribute), l=lock)
+
+
+def _set_plug_states(node: str, attributes: list[str], chunk: str, **flags: any) -> bool:
+    """Set the same state flags on many attributes of a node in a single undo step
+
+    Args:
+        node (str): Name of the node
+        attributes (list[str]): List of attributes, the missing ones are skipped
+        chunk (str): Name of the undo chunk
+        flags (any): setAttr flags to set on every attribute
+
+    Returns:
+        bool: True once the flags are set, even if there is nothing to set,
+              False if the node is missing
+    """
+
+    if not cmds.objExists(node):
+        return False
+
+    plugs = [_plug_name(node, attribute) for attribute in attributes or _EMPTY
+             if attribute_exists(node=node, attribute=attribute)]
+    if not plugs:
+        return True
+
+    with _undo_chunk(chunk):
+        if all(_MEL_SAFE_RE.fullmatch(plug) for plug in plugs):
+            # A single MEL loop runs every setAttr without going back to Python
+            names = ', '.join(f'"{plug}"' for plug in plugs)
+            options = ' '.join(f'-{flag} {int(value)}' for flag, value in flags.items())
+            mel.eval(f'{{ string $plugs[] = {{{names}}}; '
+                     f'for ($plug in $plugs) setAttr {options} $plug; }}')
+        else:
+            for plug in plugs:
+                cmds.setAttr(plug, **flags)
+
+    return True
 
 
 # VALIDATORS
@@ -21,7 +222,7 @@ def attribute_exists(node: str, attribute: str) -> bool:
         True
     """
 
-    return cmds.attributeQuery(attribute, n=node, ex=True)
+    return _get_plug(node, attribute) is not None
 
 
 def is_attribute_locked(node: str, attribute: str) -> bool:
@@ -39,10 +240,9 @@ def is_attribute_locked(node: str, attribute: str) -> bool:
         True
     """
 
-    if not attribute_exists(node=node, attribute=attribute):
-        return False
+    plug = _get_plug(node, attribute)
 
-    return cmds.getAttr(f'{node}.{attribute}', l=True)
+    return plug is not None and plug.isLocked
 
 
 def is_attribute_keyable(node: str, attribute: str) -> bool:
@@ -60,13 +260,9 @@ def is_attribute_keyable(node: str, attribute: str) -> bool:
         True
     """
 
-    if not attribute_exists(node=node, attribute=attribute):
-        return False
-
-    if is_attribute_locked(node=node, attribute=attribute):
-        return False
+    plug = _get_plug(node, attribute)
 
-    return cmds.getAttr(f'{node}.{attribute}', k=True)
+    return plug is not None and plug.isKeyable and not plug.isLocked
 
 
 # GETTERS
@@ -88,7 +284,7 @@ def get_attr_value(node: str, attribute: str, **kwargs: any) -> any:
     if not attribute_exists(node=node, attribute=attribute):
         return None
 
-    return cmds.getAttr(f'{node}.{attribute}', **kwargs)
+    return cmds.getAttr(_plug_name(node, attribute), **kwargs)
 
 
 def get_user_defined_attrs(node: str) -> list[str]:
@@ -122,11 +318,23 @@ def get_attribute_type(node: str, attribute: str) -> str:
         >>> get_attr_type('myAttribute')
         'float'
 
+    Note:
+        The type of a static attribute is cached per node type
     """
-    if not attribute_exists(node=node, attribute=attribute):
+
+    plug = _get_plug(node, attribute)
+    if plug is None:
         return None
 
-    return cmds.getAttr(f'{node}.{attribute}', typ=True)
+    key = _static_key(plug, attribute)
+    attribute_type = _ATTRIBUTE_TYPES.get(key)
+
+    if attribute_type is None:
+        attribute_type = cmds.getAttr(_plug_name(node, attribute), typ=True)
+        if key is not None:
+            _ATTRIBUTE_TYPES[key] = attribute_type
+
+    return attribute_type
 
 
 def get_default_value(node: str, attribute: str) -> any:
@@ -139,15 +347,28 @@ def get_default_value(node: str, attribute: str) -> any:
     Returns:
         any: default value of the attribute
 
+    Note:
+        The default value of a static attribute is cached per node type, the
+        default value of a dynamic attribute is read every time
+
     Example:
         >>> get_default_value('translateX')
         0.0
     """
 
-    if not attribute_exists(node=node, attribute=attribute):
+    plug = _get_plug(node, attribute)
+    if plug is None:
         return None
 
-    return cmds.attributeQuery(attribute, n=node, ld=True)
+    key = _static_key(plug, attribute)
+    if key in _DEFAULT_VALUES:
+        default_value = _DEFAULT_VALUES[key]
+    else:
+        default_value = cmds.attributeQuery(attribute, n=node, ld=True)
+        if key is not None:
+            _DEFAULT_VALUES[key] = default_value
+
+    return list(default_value) if isinstance(default_value, list) else default_value
 
 
 # SETTERS
@@ -170,7 +391,7 @@ def set_attribute_value(node: str, attribute: str, value: any, **kwargs: any) ->
     if not attribute_exists(node=node, attribute=attribute):
         return False
 
-    cmds.setAttr(f'{node}.{attribute}', value, **kwargs)
+    cmds.setAttr(_plug_name(node, attribute), value, **kwargs)
 
     return True
 
@@ -194,7 +415,7 @@ def set_keyable_attribute(node: str, attribute: str, keyable: bool = True) -> bo
     if not attribute_exists(node=node, attribute=attribute):
         return False
 
-    cmds.setAttr(f'{node}.{attribute}', k=keyable, cb=not keyable)
+    cmds.setAttr(_plug_name(node, attribute), k=keyable, cb=not keyable)
     return True
 
 
@@ -217,15 +438,18 @@ def set_default_value(node: str, attribute: str, value: any, **kwargs: any) -> b
     if not attribute_exists(node=node, attribute=attribute):
         return False
 
-    lock = False
-    if is_attribute_locked(node=node, attribute=attribute):
-        lock_attribute(node=node, attribute=attribute, lock=False)
-        lock = True
+    locked = is_attribute_locked(node=node, attribute=attribute)
+    if locked:
+        _lock_attribute_unchecked(node, attribute, False)
 
-    cmds.addAttr(f'{node}.{attribute}', e=True, dv=value, **kwargs)
-    cmds.setAttr(f'{node}.{attribute}', value, **kwargs)
+    plug = _plug_name(node, attribute)
+    cmds.addAttr(plug, e=True, dv=value, **kwargs)
 
-    lock_attribute(node=node, attribute=attribute, lock=lock)
+    if not _is_same_value(cmds.getAttr(plug), value):
+        cmds.setAttr(plug, value, **kwargs)
+
+    if locked:
+        _lock_attribute_unchecked(node, attribute, True)
 
     return True
 
@@ -249,7 +473,7 @@ def lock_attribute(node: str, attribute: str, lock: bool = True) -> bool:
     if not attribute_exists(node=node, attribute=attribute):
         return False
 
-    cmds.setAttr(f'{node}.{attribute}', l=lock)
+    _lock_attribute_unchecked(node, attribute, lock)
 
     return True
 
@@ -270,10 +494,7 @@ def lock_attributes(node: str, attributes: list[str], lock: bool = True) -> bool
         True
     """
 
-    for attribute in attributes:
-        lock_attribute(node=node, attribute=attribute, lock=lock)
-
-    return True
+    return _set_plug_states(node, attributes, 'lock_attributes', l=lock)
 
 
 def hide_attribute(node: str, attribute: str, hide: bool = True) -> bool:
@@ -295,7 +516,7 @@ def hide_attribute(node: str, attribute: str, hide: bool = True) -> bool:
     if not attribute_exists(node=node, attribute=attribute):
         return False
 
-    cmds.setAttr(f'{node}.{attribute}', k=not hide, cb=not hide)
+    cmds.setAttr(_plug_name(node, attribute), k=not hide, cb=not hide)
 
     return True
 
@@ -316,10 +537,7 @@ def hide_attributes(node: str, attributes: list[str], hide: bool = True) -> bool
         True
     """
 
-    for attribute in attributes:
-        hide_attribute(node=node, attribute=attribute, hide=hide)
-
-    return True
+    return _set_plug_states(node, attributes, 'hide_attributes', k=not hide, cb=not hide)
 
 
 def lock_and_hide_attribute(node: str,
@@ -342,8 +560,10 @@ def lock_and_hide_attribute(node: str,
         True
     """
 
-    lock_attribute(node=node, attribute=attribute, lock=lock)
-    hide_attribute(node=node, attribute=attribute, hide=hide)
+    if not attribute_exists(node=node, attribute=attribute):
+        return False
+
+    cmds.setAttr(_plug_name(node, attribute), l=lock, k=not hide, cb=not hide)
 
     return True
 
@@ -368,13 +588,8 @@ def lock_and_hide_attributes(node: str,
         True
     """
 
-    for attribute in attributes:
-        lock_and_hide_attribute(node=node,
-                                attribute=attribute,
-                                lock=lock,
-                                hide=hide)
-
-    return True
+    return _set_plug_states(node, attributes, 'lock_and_hide_attributes',
+                            l=lock, k=not hide, cb=not hide)
 
 
 def lock_and_hide_all_attributes(node: str, lock: bool = True, hide: bool = True) -> bool:
@@ -387,30 +602,36 @@ def lock_and_hide_all_attributes(node: str, lock: bool = True, hide: bool = True
         hide (bool, optional): True to hide the attributes. Defaults to True.
 
     Returns:
-        bool: True if the attributes are locked and hidden
+        bool: True if the attributes are locked and hidden, False if the node is missing
 
     Example:
         >>> lock_and_hide_all()
         True
     """
 
-    for attribute in cmds.listAttr(node, k=True):
-        lock_and_hide_attribute(node=node,
-                                attribute=attribute,
-                                lock=lock,
-                                hide=hide)
+    if not cmds.objExists(node):
+        return False
+
+    with _undo_chunk('lock_and_hide_all_attributes'):
+        for attribute in cmds.listAttr(node, k=True) or _EMPTY:
+            cmds.setAttr(_plug_name(node, attribute), l=lock, k=not hide, cb=not hide)
 
     return True
 
 
 # ADDERS
-def add_attribute(node: str, attribute: str, keyable: bool = True, **kwargs: any) -> str:
+def add_attribute(node: str,
+                  attribute: str,
+                  keyable: bool = True,
+                  lock: bool = False,
+                  **kwargs: any) -> str:
     """Add an attribute to the node
 
     Args:
         node (str): Name of the node
         attribute (str): Name of the attribute
         keyable (bool, optional): True == keyable. Defaults to True.
+        lock (bool, optional): True to lock the attribute once added. Defaults to False.
 
     Returns:
         str: name of the attribute
@@ -424,8 +645,12 @@ def add_attribute(node: str, attribute: str, keyable: bool = True, **kwargs: any
         raise ValueError(
             f'Attribute "{attribute}" already exists in "{node}" node')
 
-    cmds.addAttr(node, ln=attribute, **kwargs)
-    cmds.setAttr(f'{node}.{attribute}', k=keyable, cb=not keyable)
+    # The short flag, accepted before, would be sent twice along with keyable
+    keyable = kwargs.pop('k', keyable)
+    cmds.addAttr(node, ln=attribute, k=keyable, **kwargs)
+
+    if lock or not keyable:
+        cmds.setAttr(_plug_name(node, attribute), l=lock, cb=not keyable)
 
     return attribute
 
@@ -448,57 +673,77 @@ def add_separator(node: str, separator: str) -> str:
     add_attribute(node=node,
                   attribute=separator,
                   keyable=False,
+                  lock=True,
                   niceName=' ',
                   attributeType='enum',
                   enumName=separator)
-    lock_attribute(node=node, attribute=separator)
 
     return separator
 
 
-def add_float_attribute(node: str, attribute: str, keyable: bool = True, **kwargs: any) -> str:
+def add_float_attribute(node: str,
+                        attribute: str,
+                        keyable: bool = True,
+                        min_value: float = None,
+                        max_value: float = None,
+                        default_value: float = None,
+                        **kwargs: any) -> str:
     """Add a float attribute to the node
 
     Args:
         node (str): Name of the node
         attribute (str): Name of the attribute
         keyable (bool, optional): True == keyable. Defaults to True.
+        min_value (float, optional): Minimum value. Defaults to None.
+        max_value (float, optional): Maximum value. Defaults to None.
+        default_value (float, optional): Default value. Defaults to None.
 
     Returns:
         str: name of the attribute
 
     Example:
-        >>> add_float_attribute('myAttribute', keyable=True)
+        >>> add_float_attribute('myAttribute', keyable=True, min_value=0.0, max_value=1.0)
         'myAttribute'
     """
 
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         attributeType='float',
+                         **_TYPE_KWARGS['float'],
+                         **_value_flags(min_value, max_value, default_value),
                          **kwargs)
 
 
-def add_int_attribute(node: str, attribute: str, keyable: bool = True, **kwargs: any) -> str:
+def add_int_attribute(node: str,
+                      attribute: str,
+                      keyable: bool = True,
+                      min_value: int = None,
+                      max_value: int = None,
+                      default_value: int = None,
+                      **kwargs: any) -> str:
     """Add a int attribute to the node
 
     Args:
         node (str): Name of the node
         attribute (str): Name of the attribute
         keyable (bool, optional): True == keyable. Defaults to True.
+        min_value (int, optional): Minimum value. Defaults to None.
+        max_value (int, optional): Maximum value. Defaults to None.
+        default_value (int, optional): Default value. Defaults to None.
 
     Returns:
         str: name of the attribute
 
     Example:
-        >>> add_int_attribute('myAttribute', keyable=True)
+        >>> add_int_attribute('myAttribute', keyable=True, min_value=0, max_value=10)
         'myAttribute'
     """
 
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         attributeType='long',
+                         **_TYPE_KWARGS['int'],
+                         **_value_flags(min_value, max_value, default_value),
                          **kwargs)
 
 
@@ -521,7 +766,7 @@ def add_bool_attribute(node: str, attribute: str, keyable: bool = True, **kwargs
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         attributeType='bool',
+                         **_TYPE_KWARGS['bool'],
                          **kwargs)
 
 
@@ -550,7 +795,7 @@ def add_enum_attribute(node: str,
                          attribute=attribute,
                          keyable=keyable,
                          attributeType='enum',
-                         enumName=':'.join(states),
+                         enumName=_enum_name(tuple(states)),
                          **kwargs)
 
 
@@ -573,7 +818,7 @@ def add_matrix_attribute(node: str, attribute: str, keyable: bool = True, **kwar
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         attributeType='matrix',
+                         **_TYPE_KWARGS['matrix'],
                          **kwargs)
 
 
@@ -596,7 +841,7 @@ def add_string_attribute(node: str, attribute: str, keyable: bool = True, **kwar
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         dataType='string',
+                         **_TYPE_KWARGS['string'],
                          **kwargs)
 
 
@@ -619,7 +864,7 @@ def add_message_attribute(node: str, attribute: str, keyable: bool = True, **kwa
     return add_attribute(node=node,
                          attribute=attribute,
                          keyable=keyable,
-                         attributeType='message',
+                         **_TYPE_KWARGS['message'],
                          **kwargs)
 
 
@@ -643,10 +888,9 @@ def delete_attribute(node: str, attribute: str, **kwargs) -> bool:
         return False
 
     if is_attribute_locked(node=node, attribute=attribute):
-        lock_attribute(node=node, attribute=attribute, lock=False)
+        _lock_attribute_unchecked(node, attribute, False)
 
     cmds.deleteAttr(node, at=attribute, **kwargs)
-
     return True
 
 
@@ -658,14 +902,65 @@ def delete_attributes(node: str, attributes: list, **kwargs) -> bool:
         attributes (list): list of attributes
 
     Returns:
-        bool: True if the attributes are deleted
+        bool: True if the attributes are deleted or none of them exists,
+              False if the node is missing
 
     Example:
         >>> delete_attrs(['myAttribute', 'myAttribute2'])
         True
     """
 
-    for attribute in attributes:
-        delete_attribute(node=node, attribute=attribute, **kwargs)
+    if not cmds.objExists(node):
+        return False
+
+    existing = [attribute for attribute in attributes or _EMPTY
+                if attribute_exists(node=node, attribute=attribute)]
+    if not existing:
+        return True
+
+    locked = [attribute for attribute in existing
+              if is_attribute_locked(node=node, attribute=attribute)]
+
+    with _undo_chunk('delete_attributes'):
+        for attribute in locked:
+            _lock_attribute_unchecked(node, attribute, False)
+
+        for attribute in existing:
+            # Deleting a compound attribute also deletes its children
+            if _get_plug(node, attribute) is not None:
+                cmds.deleteAttr(node, at=attribute, **kwargs)
 
     return True
+
+
+# BATCH
+@contextlib.contextmanager
+def bulk_edit() -> None:
+    """Run a whole pass of attribute edits as a single undo step, with the
+    evaluation manager and the viewport suspended until the block exits
+
+    Note:
+        The suspension is only worth it around many edits, each function of
+        this module only groups its own edits in an undo step
+
+    Example:
+        >>> with bulk_edit():
+        ...     for control in controls:
+        ...         lock_and_hide_attributes(control, ['sx', 'sy', 'sz', 'v'])
+    """
+
+    with scene.Scene.suspend_evaluation(), _undo_chunk('bulk_edit'):
+        yield
+
+
+# CACHES
+def clear_attribute_cache() -> None:
+    """Drop every cached type and default value of the static attributes,
+    needed after reloading a plug-in that redefines a node type
+
+    Example:
+        >>> clear_attribute_cache()
+    """
+
+    _ATTRIBUTE_TYPES.clear()
+    _DEFAULT_VALUES.clear()
@@ -0,0 +1,88 @@
+"""
+Differential tests of the letter increments of the naming module against the
+character by character implementation they replaced
+"""
+
+import importlib.util
+import os
+import random
+import string
+import unittest
+
+_NAMING_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'lib', 'naming.py')
+_SPEC = importlib.util.spec_from_file_location('naming', _NAMING_PATH)
+naming = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(naming)
+
+# Outputs of the previous implementation, as returned before the rewrite
+_INCREMENTED = {'A': 'B', 'Z': 'AA', 'aa': 'ab', 'AZ': 'BA', 'ZZ': 'AAA', 'zz': 'aaa',
+                'spineA': 'spineB', 'arm_L': 'arm_M', 'ctrlAZ': 'ctrlA[', 'Za': 'Zb',
+                'spineZ': 'spine[', 'ab_zz': 'ab`aa', 'L_arm1': 'L_arm2'}
+_DECREMENTED = {'B': 'A', 'AA': 'Z', 'a': '', 'BA': 'AZ', 'aaa': 'zz', 'AAA': 'ZZ',
+                'spineA': 'spine@', 'arm_L': 'arm_K', 'ctrlAZ': 'ctrlAY', 'Za': 'Z`',
+                'spineB': 'spineA', 'L_arm2': 'L_arm1'}
+
+
+def _legacy_shift(text: str, step: int) -> str:
+    """The previous character by character implementation of both functions
+
+    Args:
+        text (str): The text to shift
+        step (int): 1 to increment, -1 to decrement
+
+    Returns:
+        str: The shifted text
+    """
+
+    text = list(text)
+    is_upper = text[0].isupper()
+    start_char = 'A' if is_upper else 'a'
+    end_char = 'Z' if is_upper else 'z'
+    limit, reset = (end_char, start_char) if step > 0 else (start_char, end_char)
+
+    i = len(text) - 1
+    while i >= 0:
+        if text[i] != limit:
+            text[i] = chr(ord(text[i]) + step)
+            return ''.join(text)
+        text[i] = reset
+        i -= 1
+
+    if step > 0:
+        return start_char + ''.join(text)
+
+    return ''.join(text[1:])
+
+
+class TestLetterShift(unittest.TestCase):
+    """
+    TestLetterShift class
+    """
+
+    def test_known_outputs(self) -> None:
+        """The previous outputs are kept for letters, mixed case and other characters"""
+
+        for text, expected in _INCREMENTED.items():
+            self.assertEqual(naming.increment_character(text), expected, text)
+
+        for text, expected in _DECREMENTED.items():
+            self.assertEqual(naming.decrement_character(text), expected, text)
+
+    def test_random_texts(self) -> None:
+        """Random names give the same result as the previous implementation"""
+
+        generator = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + '_|:[]`{@'
+        texts = [''.join(generator.choice(alphabet) for _ in range(generator.randint(1, 8)))
+                 for _ in range(20000)]
+        texts += [''.join(generator.choice('azAZbyBY_') for _ in range(generator.randint(1, 6)))
+                  for _ in range(20000)]
+
+        for text in texts:
+            self.assertEqual(naming.increment_character(text), _legacy_shift(text, 1), text)
+            self.assertEqual(naming.decrement_character(text), _legacy_shift(text, -1), text)
+
+
+if __name__ == '__main__':
+    unittest.main()